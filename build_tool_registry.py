@@ -0,0 +1,457 @@
+"""
+Build the operations registry from TOOL_METADATA blocks
+
+Parses every library/*/*-ops.py module once with ast (no imports, no
+load_dotenv) and writes a compact, versioned operations_registry.json.
+Each module entry carries the SHA-256 of its source, so unchanged modules
+are reused from the previous registry and stale registries are detected
+without re-parsing anything.
+
+Usage:
+    python build_tool_registry.py                    # build/refresh JSON
+    python build_tool_registry.py --format msgpack   # binary (needs msgpack)
+    python build_tool_registry.py --check            # exit 1 if stale
+"""
+
+import argparse
+import ast
+import glob
+import hashlib
+import json
+import os
+import re
+import sys
+
+try:
+    import msgpack
+except ImportError:
+    msgpack = None
+
+REGISTRY_VERSION = 1
+OPS_GLOB = os.path.join("library", "*", "*-ops.py")
+DEFAULT_OUTPUT = "operations_registry.json"
+
+
+def source_hash(source_bytes):
+    """Return the hex SHA-256 of a module's source bytes"""
+    return hashlib.sha256(source_bytes).hexdigest()
+
+
+def _parse_scalar(value):
+    """Convert a TOOL_METADATA scalar to bool/int/str"""
+    value = value.strip()
+    if len(value) >= 2 and value[0] == value[-1] and value[0] in "\"'":
+        return value[1:-1]
+    lowered = value.lower()
+    if lowered in ("true", "yes"):
+        return True
+    if lowered in ("false", "no"):
+        return False
+    if lowered in ("null", "none", "~"):
+        return None
+    if value.lstrip("-").isdigit():
+        return int(value)
+    if value.startswith("[") and value.endswith("]"):
+        return [_parse_scalar(v) for v in value[1:-1].split(",") if v.strip()]
+    return value
+
+
+class MetadataParseError(ValueError):
+    """Raised when a TOOL_METADATA block cannot be parsed unambiguously"""
+
+
+_MAPPING_ITEM = re.compile(r"^[A-Za-z_][\w-]*:(\s|$)")
+
+
+def _indent_of(line):
+    return len(line) - len(line.lstrip())
+
+
+def _next_content(lines, i):
+    """Index of the next non-blank line at or after i"""
+    while i < len(lines) and not lines[i].strip():
+        i += 1
+    return i
+
+
+def _parse_block(lines, start, indent):
+    """
+    Parse an indentation-based key/value block starting at lines[start].
+
+    Returns (value, next_index). The value is a list when the block is made
+    of "- item" lines, otherwise a dict. A "- key: value" item is a mapping
+    that also collects the keys indented under it. A line indented deeper
+    than the block right after a scalar continues that scalar. Mixing list
+    items and keys at one level, or any other deeper line, raises
+    MetadataParseError rather than dropping data.
+    """
+    result = None
+    last_scalar = None  # (container, key) of the scalar a deeper line may continue
+    i = start
+    while i < len(lines):
+        raw = lines[i]
+        if not raw.strip():
+            i += 1
+            continue
+        line_indent = _indent_of(raw)
+        if line_indent < indent:
+            break
+        text = raw.strip()
+
+        if line_indent > indent:
+            # Continuation of a wrapped value, even if the text has a colon
+            if last_scalar is None:
+                raise MetadataParseError(f"unexpected indentation: {text!r}")
+            container, slot = last_scalar
+            if not isinstance(container[slot], str):
+                raise MetadataParseError(f"continuation of a non-text value: {text!r}")
+            container[slot] = f"{container[slot]} {text}"
+            i += 1
+            continue
+        last_scalar = None
+
+        if text == "-" or text.startswith("- "):
+            if result is None:
+                result = []
+            if not isinstance(result, list):
+                raise MetadataParseError(f"list item inside a mapping: {text!r}")
+            item = text[1:].strip()
+            if _MAPPING_ITEM.match(item):
+                # Re-read the item as a mapping indented past the dash
+                item_indent = line_indent + (len(text) - len(item))
+                lines[i] = " " * item_indent + item
+                value, i = _parse_block(lines, i, item_indent)
+                result.append(value)
+                continue
+            result.append(_parse_scalar(item) if item else None)
+            last_scalar = (result, len(result) - 1)
+            i += 1
+            continue
+
+        key, sep, value = text.partition(":")
+        if not sep:
+            raise MetadataParseError(f"unexpected line: {text!r}")
+        if result is None:
+            result = {}
+        if not isinstance(result, dict):
+            raise MetadataParseError(f"mapping key inside a list: {text!r}")
+
+        key = key.strip()
+        if value.strip():
+            result[key] = _parse_scalar(value)
+            last_scalar = (result, key)
+            i += 1
+            continue
+
+        # Nested block: more-indented lines, or "- " items at the same indent
+        j = _next_content(lines, i + 1)
+        if j < len(lines):
+            child = lines[j]
+            child_indent = _indent_of(child)
+            is_item = child.strip() == "-" or child.strip().startswith("- ")
+            if child_indent > line_indent or (child_indent == line_indent and is_item):
+                result[key], i = _parse_block(lines, j, child_indent)
+                continue
+        result[key] = None
+        i += 1
+    return (result if result is not None else {}), i
+
+
+def parse_tool_metadata(docstring):
+    """
+    Extract the TOOL_METADATA block from a docstring as a dict.
+
+    Returns None when the docstring has no TOOL_METADATA block and raises
+    MetadataParseError when the block is malformed.
+    """
+    if not docstring or "TOOL_METADATA:" not in docstring:
+        return None
+    lines = docstring.expandtabs().split("\n")
+    for idx, line in enumerate(lines):
+        if line.strip() == "TOOL_METADATA:":
+            base_indent = len(line) - len(line.lstrip())
+            j = idx + 1
+            while j < len(lines) and not lines[j].strip():
+                j += 1
+            if j >= len(lines):
+                return {}
+            child_indent = len(lines[j]) - len(lines[j].lstrip())
+            if child_indent <= base_indent:
+                return {}
+            metadata, _ = _parse_block(lines, j, child_indent)
+            if not isinstance(metadata, dict):
+                raise MetadataParseError("TOOL_METADATA must be a mapping")
+            return metadata
+    return None
+
+
+def _signature_parameters(node):
+    """Describe a function's parameters from its AST node"""
+    args = node.args
+    positional = args.posonlyargs + args.args
+    defaults = [None] * (len(positional) - len(args.defaults)) + list(args.defaults)
+    params = []
+    for arg, default in zip(positional, defaults):
+        params.append(_describe_arg(arg, default))
+    for arg, default in zip(args.kwonlyargs, args.kw_defaults):
+        params.append(_describe_arg(arg, default))
+    return params
+
+
+def _describe_arg(arg, default):
+    """Build the registry entry for one function argument"""
+    entry = {"name": arg.arg, "required": default is None}
+    if arg.annotation is not None:
+        entry["type"] = ast.unparse(arg.annotation)
+    if default is not None:
+        entry["default"] = ast.unparse(default)
+    return entry
+
+
+def parse_module(path, source_bytes):
+    """Parse one ops module into its registry entry"""
+    tree = ast.parse(source_bytes, filename=path)
+    module_doc = ast.get_docstring(tree) or ""
+
+    version = None
+    for line in module_doc.splitlines():
+        stripped = line.strip()
+        if stripped.lower().startswith("version:"):
+            version = stripped.split(":", 1)[1].strip().lstrip("v")
+            break
+
+    operations = []
+    errors = []
+    for node in tree.body:
+        if not isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+            continue
+        if node.name.startswith("_"):
+            continue
+        try:
+            metadata = parse_tool_metadata(ast.get_docstring(node))
+        except MetadataParseError as e:
+            errors.append(f"{node.name} (line {node.lineno}): malformed TOOL_METADATA: {e}")
+            continue
+        if metadata is None:
+            continue
+        operations.append({
+            "name": metadata.get("name", node.name),
+            "function": node.name,
+            "category": metadata.get("category"),
+            "subcategory": metadata.get("subcategory"),
+            "description": metadata.get("description"),
+            "dangerous": metadata.get("dangerous") is True,
+            "signature": _signature_parameters(node),
+            "metadata": metadata,
+        })
+
+    return {
+        "module": os.path.splitext(os.path.basename(path))[0],
+        "path": path.replace(os.sep, "/"),
+        "version": version,
+        "source_sha256": source_hash(source_bytes),
+        "operations": operations,
+        "errors": errors,
+    }
+
+
+def discover_modules(pattern=OPS_GLOB):
+    """Return the sorted list of ops module paths"""
+    return sorted(glob.glob(pattern))
+
+
+class RegistryError(Exception):
+    """Raised when the modules cannot produce a consistent registry"""
+
+    def __init__(self, problems):
+        super().__init__("; ".join(problems))
+        self.problems = problems
+
+
+def build_registry(paths, previous=None):
+    """
+    Build a registry for the given module paths.
+
+    Entries from ``previous`` whose source hash still matches are reused
+    as-is, so only changed modules are parsed. Returns (registry, rebuilt)
+    where ``rebuilt`` lists the module paths that had to be parsed. The
+    registry content depends only on the sources, so an unchanged tree
+    yields an identical registry.
+
+    Raises RegistryError for malformed TOOL_METADATA blocks and for
+    operation names defined in more than one module.
+    """
+    previous_modules = {}
+    if previous and previous.get("registry_version") == REGISTRY_VERSION:
+        previous_modules = previous.get("modules", {})
+
+    modules = {}
+    rebuilt = []
+    for path in paths:
+        with open(path, "rb") as f:
+            source_bytes = f.read()
+        key = path.replace(os.sep, "/")
+        cached = previous_modules.get(key)
+        if cached and cached.get("source_sha256") == source_hash(source_bytes):
+            modules[key] = cached
+            continue
+        modules[key] = parse_module(path, source_bytes)
+        rebuilt.append(key)
+
+    problems = []
+    index = {}
+    for key, entry in modules.items():
+        problems.extend(f"{key}: {error}" for error in entry.get("errors", []))
+        for op in entry["operations"]:
+            if op["name"] in index:
+                problems.append(f"Operation '{op['name']}' defined in both {index[op['name']]} and {key}")
+                continue
+            index[op["name"]] = key
+    if problems:
+        raise RegistryError(problems)
+
+    digest = hashlib.sha256()
+    for key in sorted(modules):
+        digest.update(f"{key}:{modules[key]['source_sha256']}\n".encode("utf-8"))
+
+    registry = {
+        "registry_version": REGISTRY_VERSION,
+        "source_digest": digest.hexdigest(),
+        "modules": modules,
+        "index": index,
+    }
+    return registry, rebuilt
+
+
+def _format_for(path):
+    """Guess the serialization format from the file extension"""
+    return "msgpack" if path.endswith((".msgpack", ".mpk")) else "json"
+
+
+def load_registry(path=DEFAULT_OUTPUT, fmt=None):
+    """
+    Load a registry file without importing any module.
+
+    ``fmt`` is "json" or "msgpack"; it defaults to the file extension.
+    """
+    if not os.path.exists(path):
+        return None
+    if (fmt or _format_for(path)) == "msgpack":
+        if msgpack is None:
+            raise ImportError("msgpack is required to read " + path)
+        with open(path, "rb") as f:
+            return msgpack.unpackb(f.read(), raw=False)
+    with open(path, "r", encoding="utf-8") as f:
+        return json.load(f)
+
+
+def save_registry(registry, path=DEFAULT_OUTPUT, fmt=None):
+    """Write a registry file in ``fmt`` (default: by extension); JSON is compact"""
+    if (fmt or _format_for(path)) == "msgpack":
+        if msgpack is None:
+            raise ImportError("msgpack is required to write " + path)
+        with open(path, "wb") as f:
+            f.write(msgpack.packb(registry, use_bin_type=True))
+        return
+    with open(path, "w", encoding="utf-8") as f:
+        json.dump(registry, f, separators=(",", ":"), sort_keys=True)
+
+
+def stale_modules(registry, paths):
+    """Return module paths whose source no longer matches the registry"""
+    modules = (registry or {}).get("modules", {})
+    keys = [path.replace(os.sep, "/") for path in paths]
+    stale = []
+    for path, key in zip(paths, keys):
+        entry = modules.get(key)
+        with open(path, "rb") as f:
+            current = source_hash(f.read())
+        if entry is None or entry.get("source_sha256") != current:
+            stale.append(key)
+    known = set(keys)
+    stale.extend(key for key in modules if key not in known)
+    return stale
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Build operations_registry from TOOL_METADATA")
+    parser.add_argument("--output", "-o", help=f"registry path (default: {DEFAULT_OUTPUT})")
+    parser.add_argument("--format", choices=["json", "msgpack"], help="default: from --output extension, else json")
+    parser.add_argument("--pattern", default=OPS_GLOB, help="glob for ops modules")
+    parser.add_argument("--check", action="store_true", help="only report staleness, exit 1 if stale")
+    parser.add_argument("--force", action="store_true", help="ignore the previous registry")
+    args = parser.parse_args(argv)
+
+    output = args.output
+    if output is None:
+        output = "operations_registry.msgpack" if args.format == "msgpack" else DEFAULT_OUTPUT
+    fmt = args.format or _format_for(output)
+    if args.output and args.format and (output.endswith(".json") or _format_for(output) == "msgpack") \
+            and _format_for(output) != fmt:
+        print(f"❌ --format {fmt} conflicts with the extension of {output}")
+        return 1
+
+    print("=" * 70)
+    print("OPERATIONS REGISTRY BUILD")
+    print("=" * 70)
+
+    paths = discover_modules(args.pattern)
+    if not paths:
+        print(f"❌ No ops modules found for pattern: {args.pattern}")
+        return 1
+
+    try:
+        previous = None if args.force else load_registry(output, fmt)
+    except (ImportError, ValueError, OSError) as e:
+        print(f"⚠️  Ignoring unreadable registry {output}: {e}")
+        previous = None
+
+    if args.check:
+        stale = stale_modules(previous, paths)
+        if stale:
+            print(f"❌ Registry {output} is stale:")
+            for key in stale:
+                print(f"   - {key}")
+            return 1
+        print(f"✅ Registry {output} is up to date ({len(paths)} modules)")
+        return 0
+
+    try:
+        registry, rebuilt = build_registry(paths, previous)
+    except RegistryError as e:
+        print("❌ Registry not written:")
+        for problem in e.problems:
+            print(f"   - {problem}")
+        return 1
+
+    unchanged = registry == previous
+    if not unchanged:
+        try:
+            save_registry(registry, output, fmt)
+        except ImportError as e:
+            print(f"❌ {e}")
+            return 1
+
+    total_ops = sum(len(m["operations"]) for m in registry["modules"].values())
+    dangerous = sorted(
+        op["name"]
+        for m in registry["modules"].values()
+        for op in m["operations"]
+        if op["dangerous"]
+    )
+
+    print(f"\n   Modules: {len(paths)} ({len(rebuilt)} parsed, {len(paths) - len(rebuilt)} unchanged)")
+    for key in rebuilt:
+        print(f"      - {key}")
+    print(f"   Operations: {total_ops}")
+    print(f"   Dangerous: {', '.join(dangerous) if dangerous else 'none'}")
+    if unchanged:
+        print(f"\n✅ Registry {output} already up to date, not rewritten")
+    else:
+        print(f"\n✅ Registry written to {output} ({os.path.getsize(output):,} bytes)")
+    print("=" * 70)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,1134 @@
+"""
+Offline GitHub REST API stand-in for fast, deterministic github-ops runs
+
+Implements the endpoints github-ops.py uses (repos, forks, branches/refs,
+contents with base64 and git blob SHAs, issues, pull requests with merge,
+commits and /user) on an in-process threaded HTTP server. Responses carry
+X-RateLimit-* headers and ETags (If-None-Match returns 304), list endpoints
+paginate with per_page/page and Link headers.
+
+Timestamps come from a fixed logical clock, so SHAs, ids and dates are the
+same on every run.
+
+Usage:
+    with FakeGitHubServer() as server:
+        server.seed_repository("kilgor", "dummy-repo", {"README.md": "# Dummy"})
+        config = GitHubConfig()
+        server.configure(config)      # points config.base_url at the stub
+        ...
+
+    GITHUB_OPS_OFFLINE=1 python test_all_20_functions.py   # scripts opt in
+
+    python fake_github_server.py --port 8765   # standalone, for benchmarks
+"""
+
+import argparse
+import base64
+import hashlib
+import json
+import os
+import re
+import threading
+import time
+import zlib
+from datetime import datetime, timedelta, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, quote, unquote, urlencode, urlsplit
+
+DEFAULT_USER = "kilgor"
+DEFAULT_RATE_LIMIT = 5000
+EPOCH = datetime(2025, 1, 1, tzinfo=timezone.utc)
+DOCS_URL = "https://docs.github.com/rest"
+OFFLINE_ENV = "GITHUB_OPS_OFFLINE"
+DUMMY_REPO_FILES = {
+    "README.md": "# Dummy Repository\n\nThis is a test repository for github-ops.py integration testing.\n",
+    "docs/getting-started.md": "# Getting Started\n\nWelcome to the dummy repository!\n",
+    "src/main.py": "def main():\n    print(\"Hello from dummy-repo!\")\n",
+    "data/sample.json": "{\"name\": \"dummy-repo\", \"type\": \"test-repository\"}\n",
+}
+
+
+class GitHubStubError(Exception):
+    """HTTP error raised by a route handler"""
+
+    def __init__(self, status, message, errors=None):
+        super().__init__(message)
+        self.status = status
+        self.message = message
+        self.errors = errors
+
+
+def git_blob_sha(data):
+    """Return the git blob SHA-1 for raw bytes, as GitHub reports it"""
+    return hashlib.sha1(b"blob %d\0" % len(data) + data).hexdigest()
+
+
+class FakeGitHubState:
+    """In-memory repositories, commits, blobs, issues and pull requests"""
+
+    def __init__(self, user=DEFAULT_USER, rate_limit=DEFAULT_RATE_LIMIT):
+        self.lock = threading.RLock()
+        self.user = user
+        self.rate_limit = rate_limit
+        self.rate_remaining = {}
+        self.rate_reset = int(time.time()) + 3600
+        self.repos = {}
+        self.blobs = {}
+        self.commits = {}
+        self.next_id = 1
+        self.ticks = 0
+        self.request_count = 0
+        self.not_modified_count = 0
+
+    # -- helpers -----------------------------------------------------------
+
+    def now(self):
+        """Advance the logical clock and return an ISO 8601 timestamp"""
+        self.ticks += 1
+        return (EPOCH + timedelta(seconds=self.ticks)).strftime("%Y-%m-%dT%H:%M:%SZ")
+
+    def new_id(self):
+        value = self.next_id
+        self.next_id += 1
+        return value
+
+    def repo(self, owner, name):
+        repo = self.repos.get((owner.lower(), name.lower()))
+        if repo is None:
+            raise GitHubStubError(404, "Not Found")
+        return repo
+
+    def put_blob(self, data):
+        sha = git_blob_sha(data)
+        self.blobs[sha] = data
+        return sha
+
+    def make_commit(self, tree, parents, message):
+        """Store a commit for a {path: blob_sha} tree and return its SHA"""
+        date = self.now()
+        tree_sha = hashlib.sha1(json.dumps(sorted(tree.items())).encode()).hexdigest()
+        payload = json.dumps([tree_sha, parents, message, date]).encode()
+        sha = hashlib.sha1(b"commit %d\0" % len(payload) + payload).hexdigest()
+        self.commits[sha] = {
+            "sha": sha,
+            "tree": dict(tree),
+            "tree_sha": tree_sha,
+            "parents": list(parents),
+            "message": message,
+            "date": date,
+        }
+        return sha
+
+    def branch_head(self, repo, branch):
+        branch = branch or repo["default_branch"]
+        if branch not in repo["branches"]:
+            raise GitHubStubError(404, f"Branch {branch} not found")
+        return branch, repo["branches"][branch]
+
+    def resolve_ref(self, repo, ref):
+        """Resolve a branch name or commit SHA to a commit SHA (or None)"""
+        if not repo["branches"]:
+            return None
+        if not ref:
+            return repo["branches"][repo["default_branch"]]
+        if ref in repo["branches"]:
+            return repo["branches"][ref]
+        if ref in self.commits:
+            return ref
+        raise GitHubStubError(404, f"No commit found for the ref {ref}")
+
+    def ancestors(self, sha):
+        seen = set()
+        stack = [sha]
+        while stack:
+            current = stack.pop()
+            if current in seen:
+                continue
+            seen.add(current)
+            stack.extend(self.commits[current]["parents"])
+        return seen
+
+    # -- seeding -----------------------------------------------------------
+
+    def create_repository(self, owner, name, private=False, description=None,
+                          default_branch="main", fork_of=None):
+        key = (owner.lower(), name.lower())
+        if key in self.repos:
+            raise GitHubStubError(422, "Repository creation failed: name already exists on this account")
+        created = self.now()
+        repo = {
+            "id": self.new_id(),
+            "owner": owner,
+            "name": name,
+            "private": private,
+            "description": description,
+            "default_branch": default_branch,
+            "fork": fork_of is not None,
+            "created_at": created,
+            "updated_at": created,
+            "pushed_at": created,
+            "branches": {},
+            "issues": {},
+            "next_number": 1,
+        }
+        self.repos[key] = repo
+        return repo
+
+
+class FakeGitHubServer:
+    """
+    Threaded local HTTP server speaking the GitHub REST API subset.
+
+    Binds 127.0.0.1 on a free port by default; ``base_url`` is what
+    GitHubConfig.base_url should be set to.
+    """
+
+    def __init__(self, host="127.0.0.1", port=0, user=DEFAULT_USER,
+                 rate_limit=DEFAULT_RATE_LIMIT, token=None):
+        self.state = FakeGitHubState(user=user, rate_limit=rate_limit)
+        self.token = token
+        self._httpd = ThreadingHTTPServer((host, port), _make_handler(self))
+        self._httpd.daemon_threads = True
+        self._thread = None
+
+    @property
+    def base_url(self):
+        host, port = self._httpd.server_address[:2]
+        return f"http://{host}:{port}"
+
+    @property
+    def request_count(self):
+        return self.state.request_count
+
+    def start(self):
+        if self._thread is None:
+            self._thread = threading.Thread(target=self._httpd.serve_forever, daemon=True)
+            self._thread.start()
+        return self
+
+    def serve_forever(self):
+        """Serve on the calling thread until interrupted, then close the socket"""
+        try:
+            self._httpd.serve_forever()
+        finally:
+            self._httpd.server_close()
+
+    def stop(self):
+        if self._thread is not None:
+            self._httpd.shutdown()
+            self._thread.join()
+            self._thread = None
+        self._httpd.server_close()
+
+    def __enter__(self):
+        return self.start()
+
+    def __exit__(self, *exc):
+        self.stop()
+
+    def configure(self, config):
+        """Point a GitHubConfig (or any config with base_url) at this server"""
+        config.base_url = self.base_url
+        if not getattr(config, "token", None):
+            config.token = "offline-token"
+        headers = getattr(config, "headers", None)
+        if isinstance(headers, dict) and not headers.get("Authorization"):
+            headers["Authorization"] = f"Bearer {config.token}"
+        return config
+
+    def seed_repository(self, owner, name, files=None, default_branch="main",
+                        private=False, description=None, message="Initial commit"):
+        """Create a repository, optionally with an initial commit of files"""
+        state = self.state
+        with state.lock:
+            repo = state.create_repository(owner, name, private=private,
+                                           description=description,
+                                           default_branch=default_branch)
+            if files:
+                tree = {}
+                for path, content in files.items():
+                    data = content.encode("utf-8") if isinstance(content, str) else content
+                    tree[path] = state.put_blob(data)
+                repo["branches"][default_branch] = state.make_commit(tree, [], message)
+        return repo
+
+
+# -- JSON shapes ------------------------------------------------------------
+
+
+def _user_json(server, login):
+    base = server.base_url
+    return {
+        "login": login,
+        "id": zlib.crc32(login.lower().encode("utf-8")),
+        "type": "User",
+        "url": f"{base}/users/{login}",
+        "html_url": f"https://github.com/{login}",
+        "site_admin": False,
+    }
+
+
+def _repo_json(server, repo):
+    base = server.base_url
+    full_name = f"{repo['owner']}/{repo['name']}"
+    open_issues = sum(1 for i in repo["issues"].values() if i["state"] == "open")
+    return {
+        "id": repo["id"],
+        "node_id": f"R_{repo['id']}",
+        "name": repo["name"],
+        "full_name": full_name,
+        "owner": _user_json(server, repo["owner"]),
+        "private": repo["private"],
+        "visibility": "private" if repo["private"] else "public",
+        "description": repo["description"],
+        "fork": repo["fork"],
+        "url": f"{base}/repos/{full_name}",
+        "html_url": f"https://github.com/{full_name}",
+        "clone_url": f"https://github.com/{full_name}.git",
+        "default_branch": repo["default_branch"],
+        "created_at": repo["created_at"],
+        "updated_at": repo["updated_at"],
+        "pushed_at": repo["pushed_at"],
+        "size": 0,
+        "language": None,
+        "stargazers_count": 0,
+        "watchers_count": 0,
+        "forks_count": 0,
+        "open_issues_count": open_issues,
+        "archived": False,
+        "disabled": False,
+    }
+
+
+def _commit_json(server, repo, sha):
+    state = server.state
+    commit = state.commits[sha]
+    full_name = f"{repo['owner']}/{repo['name']}"
+    signature = {"name": state.user, "email": f"{state.user}@users.noreply.github.com", "date": commit["date"]}
+    return {
+        "sha": sha,
+        "node_id": f"C_{sha[:12]}",
+        "url": f"{server.base_url}/repos/{full_name}/commits/{sha}",
+        "html_url": f"https://github.com/{full_name}/commit/{sha}",
+        "commit": {
+            "message": commit["message"],
+            "author": signature,
+            "committer": signature,
+            "tree": {"sha": commit["tree_sha"]},
+        },
+        "author": _user_json(server, state.user),
+        "committer": _user_json(server, state.user),
+        "parents": [{"sha": p} for p in commit["parents"]],
+    }
+
+
+def _content_json(server, repo, path, blob_sha, ref, with_content=True):
+    full_name = f"{repo['owner']}/{repo['name']}"
+    data = server.state.blobs[blob_sha]
+    item = {
+        "type": "file",
+        "name": path.rsplit("/", 1)[-1],
+        "path": path,
+        "sha": blob_sha,
+        "size": len(data),
+        "url": f"{server.base_url}/repos/{full_name}/contents/{quote(path)}?ref={quote(ref, safe='')}",
+        "html_url": f"https://github.com/{full_name}/blob/{quote(ref, safe='')}/{quote(path)}",
+        "git_url": f"{server.base_url}/repos/{full_name}/git/blobs/{blob_sha}",
+        "download_url": f"{server.base_url}/raw/{full_name}/{quote(ref, safe='')}/{quote(path)}",
+    }
+    if with_content:
+        encoded = base64.b64encode(data).decode("ascii")
+        item["encoding"] = "base64"
+        item["content"] = "\n".join(encoded[i:i + 60] for i in range(0, len(encoded), 60)) + "\n"
+    return item
+
+
+def _dir_json(server, repo, path, ref):
+    full_name = f"{repo['owner']}/{repo['name']}"
+    return {
+        "type": "dir",
+        "name": path.rsplit("/", 1)[-1],
+        "path": path,
+        "sha": hashlib.sha1(f"{ref}:{path}".encode()).hexdigest(),
+        "size": 0,
+        "url": f"{server.base_url}/repos/{full_name}/contents/{quote(path)}?ref={quote(ref, safe='')}",
+        "html_url": f"https://github.com/{full_name}/tree/{quote(ref, safe='')}/{quote(path)}",
+        "git_url": None,
+        "download_url": None,
+    }
+
+
+def _issue_json(server, repo, issue):
+    full_name = f"{repo['owner']}/{repo['name']}"
+    result = {
+        "id": issue["id"],
+        "node_id": f"I_{issue['id']}",
+        "number": issue["number"],
+        "title": issue["title"],
+        "body": issue["body"],
+        "state": issue["state"],
+        "state_reason": issue.get("state_reason"),
+        "locked": False,
+        "labels": [{"name": name, "color": "ededed", "default": False} for name in issue["labels"]],
+        "assignee": _user_json(server, issue["assignees"][0]) if issue["assignees"] else None,
+        "assignees": [_user_json(server, login) for login in issue["assignees"]],
+        "milestone": None,
+        "comments": 0,
+        "user": _user_json(server, issue["user"]),
+        "author_association": "OWNER",
+        "created_at": issue["created_at"],
+        "updated_at": issue["updated_at"],
+        "closed_at": issue["closed_at"],
+        "url": f"{server.base_url}/repos/{full_name}/issues/{issue['number']}",
+        "html_url": f"https://github.com/{full_name}/issues/{issue['number']}",
+    }
+    if issue.get("pull"):
+        result["html_url"] = f"https://github.com/{full_name}/pull/{issue['number']}"
+        result["pull_request"] = {
+            "url": f"{server.base_url}/repos/{full_name}/pulls/{issue['number']}",
+            "html_url": result["html_url"],
+            "merged_at": issue["pull"]["merged_at"],
+        }
+    return result
+
+
+def _pull_json(server, repo, issue):
+    full_name = f"{repo['owner']}/{repo['name']}"
+    pull = issue["pull"]
+    head_sha = repo["branches"].get(pull["head"], pull["head_sha"])
+    base_sha = repo["branches"].get(pull["base"])
+    return {
+        "id": issue["id"],
+        "node_id": f"PR_{issue['id']}",
+        "number": issue["number"],
+        "state": issue["state"],
+        "title": issue["title"],
+        "body": issue["body"],
+        "user": _user_json(server, issue["user"]),
+        "draft": pull["draft"],
+        "merged": pull["merged_at"] is not None,
+        "mergeable": issue["state"] == "open",
+        "merged_at": pull["merged_at"],
+        "merge_commit_sha": pull["merge_commit_sha"],
+        "created_at": issue["created_at"],
+        "updated_at": issue["updated_at"],
+        "closed_at": issue["closed_at"],
+        "head": {"label": f"{repo['owner']}:{pull['head']}", "ref": pull["head"], "sha": head_sha},
+        "base": {"label": f"{repo['owner']}:{pull['base']}", "ref": pull["base"], "sha": base_sha},
+        "url": f"{server.base_url}/repos/{full_name}/pulls/{issue['number']}",
+        "html_url": f"https://github.com/{full_name}/pull/{issue['number']}",
+    }
+
+
+# -- route handlers ---------------------------------------------------------
+
+
+def _get_user(server, req):
+    state = server.state
+    user = _user_json(server, state.user)
+    owned = [r for r in state.repos.values() if r["owner"].lower() == state.user.lower()]
+    user.update({
+        "name": state.user,
+        "public_repos": sum(1 for r in owned if not r["private"]),
+        "total_private_repos": sum(1 for r in owned if r["private"]),
+        "created_at": EPOCH.strftime("%Y-%m-%dT%H:%M:%SZ"),
+    })
+    return 200, user
+
+
+def _list_repos(server, req, owner=None):
+    state = server.state
+    owner = owner or state.user
+    repos = [r for r in state.repos.values() if r["owner"].lower() == owner.lower()]
+    sort = req.query.get("sort", "full_name")
+    if sort == "full_name":
+        repos.sort(key=lambda r: r["name"].lower())
+    else:
+        field = {"created": "created_at", "updated": "updated_at", "pushed": "pushed_at"}.get(sort, "created_at")
+        repos.sort(key=lambda r: r[field], reverse=req.query.get("direction", "desc") == "desc")
+    return 200, [_repo_json(server, r) for r in repos]
+
+
+def _get_repo(server, req, owner, name):
+    return 200, _repo_json(server, server.state.repo(owner, name))
+
+
+def _delete_repo(server, req, owner, name):
+    state = server.state
+    state.repo(owner, name)
+    del state.repos[(owner.lower(), name.lower())]
+    return 204, None
+
+
+def _fork_repo(server, req, owner, name):
+    state = server.state
+    source = state.repo(owner, name)
+    fork_owner = req.body.get("organization") or state.user
+    fork_name = req.body.get("name") or source["name"]
+    existing = state.repos.get((fork_owner.lower(), fork_name.lower()))
+    if existing is not None:
+        return 202, _repo_json(server, existing)
+    fork = state.create_repository(fork_owner, fork_name, private=source["private"],
+                                   description=source["description"],
+                                   default_branch=source["default_branch"], fork_of=source)
+    if req.body.get("default_branch_only"):
+        branches = {source["default_branch"]: source["branches"][source["default_branch"]]} if source["branches"] else {}
+    else:
+        branches = dict(source["branches"])
+    fork["branches"] = branches
+    return 202, _repo_json(server, fork)
+
+
+def _list_branches(server, req, owner, name):
+    repo = server.state.repo(owner, name)
+    full_name = f"{repo['owner']}/{repo['name']}"
+    return 200, [
+        {
+            "name": branch,
+            "commit": {"sha": sha, "url": f"{server.base_url}/repos/{full_name}/commits/{sha}"},
+            "protected": False,
+        }
+        for branch, sha in sorted(repo["branches"].items())
+    ]
+
+
+def _get_branch(server, req, owner, name, branch):
+    repo = server.state.repo(owner, name)
+    branch, sha = server.state.branch_head(repo, unquote(branch))
+    return 200, {"name": branch, "commit": _commit_json(server, repo, sha), "protected": False}
+
+
+def _ref_json(server, repo, branch, sha):
+    full_name = f"{repo['owner']}/{repo['name']}"
+    return {
+        "ref": f"refs/heads/{branch}",
+        "node_id": f"REF_{sha[:12]}",
+        "url": f"{server.base_url}/repos/{full_name}/git/refs/heads/{branch}",
+        "object": {"sha": sha, "type": "commit",
+                   "url": f"{server.base_url}/repos/{full_name}/git/commits/{sha}"},
+    }
+
+
+def _get_ref(server, req, owner, name, branch):
+    repo = server.state.repo(owner, name)
+    branch = unquote(branch)
+    if branch not in repo["branches"]:
+        raise GitHubStubError(404, "Not Found")
+    return 200, _ref_json(server, repo, branch, repo["branches"][branch])
+
+
+def _create_ref(server, req, owner, name):
+    state = server.state
+    repo = state.repo(owner, name)
+    ref = req.body.get("ref") or ""
+    sha = req.body.get("sha") or ""
+    if not ref.startswith("refs/") or ref.count("/") < 2:
+        raise GitHubStubError(422, "Reference name must start with 'refs/' and have at least two slashes.")
+    # Only branches are modelled; a tag ref would otherwise become a branch
+    if not ref.startswith("refs/heads/") or ref == "refs/heads/":
+        raise GitHubStubError(422, "Only refs/heads/* references are supported by the stub")
+    if sha not in state.commits:
+        raise GitHubStubError(422, "Object does not exist")
+    branch = ref[len("refs/heads/"):]
+    if branch in repo["branches"]:
+        raise GitHubStubError(422, "Reference already exists")
+    repo["branches"][branch] = sha
+    return 201, _ref_json(server, repo, branch, sha)
+
+
+def _delete_ref(server, req, owner, name, branch):
+    repo = server.state.repo(owner, name)
+    branch = unquote(branch)
+    if branch not in repo["branches"]:
+        raise GitHubStubError(422, "Reference does not exist")
+    if branch == repo["default_branch"]:
+        raise GitHubStubError(422, "Cannot delete the default branch")
+    del repo["branches"][branch]
+    return 204, None
+
+
+_RAW_MEDIA_TYPE = re.compile(r"application/vnd\.github(\.[\w-]+)*\.raw\b")
+
+
+def _get_contents(server, req, owner, name, path=""):
+    state = server.state
+    repo = state.repo(owner, name)
+    path = unquote(path).strip("/")
+    ref = req.query.get("ref")
+    sha = state.resolve_ref(repo, ref)
+    if sha is None:
+        raise GitHubStubError(404, "This repository is empty.")
+    ref_name = ref or repo["default_branch"]
+    tree = state.commits[sha]["tree"]
+
+    if path in tree:
+        if _RAW_MEDIA_TYPE.search(req.headers.get("Accept", "")):
+            return 200, state.blobs[tree[path]]
+        return 200, _content_json(server, repo, path, tree[path], ref_name)
+
+    prefix = f"{path}/" if path else ""
+    entries = {}
+    for file_path, blob_sha in tree.items():
+        if not file_path.startswith(prefix):
+            continue
+        head, sep, _ = file_path[len(prefix):].partition("/")
+        if sep:
+            entries.setdefault(prefix + head, None)
+        else:
+            entries[file_path] = blob_sha
+    if not entries:
+        raise GitHubStubError(404, "Not Found")
+
+    listing = []
+    for entry_path in sorted(entries, key=lambda p: p.rsplit("/", 1)[-1].lower()):
+        blob_sha = entries[entry_path]
+        if blob_sha is None:
+            listing.append(_dir_json(server, repo, entry_path, ref_name))
+        else:
+            listing.append(_content_json(server, repo, entry_path, blob_sha, ref_name, with_content=False))
+    return 200, listing
+
+
+def _put_contents(server, req, owner, name, path):
+    state = server.state
+    repo = state.repo(owner, name)
+    path = unquote(path).strip("/")
+    body = req.body
+    if not body.get("message"):
+        raise GitHubStubError(422, "Invalid request.\n\n\"message\" wasn't supplied.")
+    if "content" not in body:
+        raise GitHubStubError(422, "Invalid request.\n\n\"content\" wasn't supplied.")
+    try:
+        data = base64.b64decode(body["content"], validate=True)
+    except (ValueError, TypeError):
+        raise GitHubStubError(422, "content is not valid Base64")
+
+    branch = body.get("branch") or repo["default_branch"]
+    if repo["branches"]:
+        branch, head = state.branch_head(repo, branch)
+        tree = dict(state.commits[head]["tree"])
+        parents = [head]
+    elif branch == repo["default_branch"]:
+        tree, parents = {}, []
+    else:
+        raise GitHubStubError(404, f"Branch {branch} not found")
+
+    existing = tree.get(path)
+    if existing is not None:
+        if not body.get("sha"):
+            raise GitHubStubError(422, "Invalid request.\n\n\"sha\" wasn't supplied.")
+        if body["sha"] != existing:
+            raise GitHubStubError(409, f"{path} does not match {body['sha']}")
+
+    tree[path] = state.put_blob(data)
+    commit_sha = state.make_commit(tree, parents, body["message"])
+    repo["branches"][branch] = commit_sha
+    repo["updated_at"] = repo["pushed_at"] = state.commits[commit_sha]["date"]
+    return (200 if existing else 201), {
+        "content": _content_json(server, repo, path, tree[path], branch, with_content=False),
+        "commit": _commit_json(server, repo, commit_sha),
+    }
+
+
+def _delete_contents(server, req, owner, name, path):
+    state = server.state
+    repo = state.repo(owner, name)
+    path = unquote(path).strip("/")
+    body = req.body
+    if not body.get("message") or not body.get("sha"):
+        raise GitHubStubError(422, "Invalid request.\n\n\"message\" and \"sha\" are required.")
+    branch, head = state.branch_head(repo, body.get("branch"))
+    tree = dict(state.commits[head]["tree"])
+    if path not in tree:
+        raise GitHubStubError(404, "Not Found")
+    if tree[path] != body["sha"]:
+        raise GitHubStubError(409, f"{path} does not match {body['sha']}")
+    del tree[path]
+    commit_sha = state.make_commit(tree, [head], body["message"])
+    repo["branches"][branch] = commit_sha
+    repo["updated_at"] = repo["pushed_at"] = state.commits[commit_sha]["date"]
+    return 200, {"content": None, "commit": _commit_json(server, repo, commit_sha)}
+
+
+def _list_commits(server, req, owner, name):
+    state = server.state
+    repo = state.repo(owner, name)
+    sha = state.resolve_ref(repo, req.query.get("sha"))
+    if sha is None:
+        raise GitHubStubError(409, "Git Repository is empty.")
+    path = req.query.get("path")
+    history = []
+    current = sha
+    while current:
+        commit = state.commits[current]
+        parent = commit["parents"][0] if commit["parents"] else None
+        if path is None or commit["tree"].get(path) != (state.commits[parent]["tree"].get(path) if parent else None):
+            history.append(_commit_json(server, repo, current))
+        current = parent
+    return 200, history
+
+
+def _list_issues(server, req, owner, name):
+    repo = server.state.repo(owner, name)
+    wanted_state = req.query.get("state", "open")
+    labels = [l for l in req.query.get("labels", "").split(",") if l]
+    issues = [
+        i for i in repo["issues"].values()
+        if (wanted_state == "all" or i["state"] == wanted_state)
+        and all(label in i["labels"] for label in labels)
+    ]
+    issues.sort(key=lambda i: i["number"], reverse=req.query.get("direction", "desc") == "desc")
+    return 200, [_issue_json(server, repo, i) for i in issues]
+
+
+def _create_issue(server, req, owner, name):
+    state = server.state
+    repo = state.repo(owner, name)
+    title = req.body.get("title")
+    if not title:
+        raise GitHubStubError(422, "Validation Failed",
+                              [{"resource": "Issue", "field": "title", "code": "missing_field"}])
+    created = state.now()
+    issue = {
+        "id": state.new_id(),
+        "number": repo["next_number"],
+        "title": str(title),
+        "body": req.body.get("body"),
+        "state": "open",
+        "labels": list(req.body.get("labels") or []),
+        "assignees": list(req.body.get("assignees") or []),
+        "user": state.user,
+        "created_at": created,
+        "updated_at": created,
+        "closed_at": None,
+    }
+    repo["next_number"] += 1
+    repo["issues"][issue["number"]] = issue
+    return 201, _issue_json(server, repo, issue)
+
+
+def _find_issue(repo, number):
+    issue = repo["issues"].get(int(number))
+    if issue is None:
+        raise GitHubStubError(404, "Not Found")
+    return issue
+
+
+def _get_issue(server, req, owner, name, number):
+    repo = server.state.repo(owner, name)
+    return 200, _issue_json(server, repo, _find_issue(repo, number))
+
+
+def _update_issue(server, req, owner, name, number):
+    state = server.state
+    repo = state.repo(owner, name)
+    issue = _find_issue(repo, number)
+    body = req.body
+    new_state = body.get("state")
+    if new_state is not None and new_state not in ("open", "closed"):
+        raise GitHubStubError(422, "Validation Failed",
+                              [{"resource": "Issue", "field": "state", "code": "invalid"}])
+    for field in ("title", "body"):
+        if field in body:
+            issue[field] = body[field]
+    if "labels" in body:
+        issue["labels"] = list(body["labels"] or [])
+    if "assignees" in body:
+        issue["assignees"] = list(body["assignees"] or [])
+    issue["updated_at"] = state.now()
+    if new_state and new_state != issue["state"]:
+        issue["state"] = new_state
+        issue["closed_at"] = issue["updated_at"] if new_state == "closed" else None
+        issue["state_reason"] = body.get("state_reason") or ("completed" if new_state == "closed" else "reopened")
+    return 200, _issue_json(server, repo, issue)
+
+
+def _list_pulls(server, req, owner, name):
+    repo = server.state.repo(owner, name)
+    wanted_state = req.query.get("state", "open")
+    pulls = [
+        i for i in repo["issues"].values()
+        if i.get("pull") and (wanted_state == "all" or i["state"] == wanted_state)
+        and (not req.query.get("base") or i["pull"]["base"] == req.query["base"])
+    ]
+    pulls.sort(key=lambda i: i["number"], reverse=req.query.get("direction", "desc") == "desc")
+    return 200, [_pull_json(server, repo, i) for i in pulls]
+
+
+def _create_pull(server, req, owner, name):
+    state = server.state
+    repo = state.repo(owner, name)
+    body = req.body
+    head = (body.get("head") or "").split(":")[-1]
+    base = body.get("base") or ""
+    errors = []
+    if not body.get("title"):
+        errors.append({"resource": "PullRequest", "field": "title", "code": "missing_field"})
+    if head not in repo["branches"]:
+        errors.append({"resource": "PullRequest", "field": "head", "code": "invalid"})
+    if base not in repo["branches"]:
+        errors.append({"resource": "PullRequest", "field": "base", "code": "invalid"})
+    if errors:
+        raise GitHubStubError(422, "Validation Failed", errors)
+    if repo["branches"][head] in state.ancestors(repo["branches"][base]):
+        raise GitHubStubError(422, "Validation Failed",
+                              [{"resource": "PullRequest", "code": "custom",
+                                "message": f"No commits between {base} and {head}"}])
+    for issue in repo["issues"].values():
+        pull = issue.get("pull")
+        if pull and issue["state"] == "open" and pull["head"] == head and pull["base"] == base:
+            raise GitHubStubError(422, "Validation Failed",
+                                  [{"resource": "PullRequest", "code": "custom",
+                                    "message": f"A pull request already exists for {repo['owner']}:{head}."}])
+    created = state.now()
+    issue = {
+        "id": state.new_id(),
+        "number": repo["next_number"],
+        "title": body["title"],
+        "body": body.get("body"),
+        "state": "open",
+        "labels": [],
+        "assignees": [],
+        "user": state.user,
+        "created_at": created,
+        "updated_at": created,
+        "closed_at": None,
+        "pull": {
+            "head": head,
+            "base": base,
+            "head_sha": repo["branches"][head],
+            "draft": bool(body.get("draft")),
+            "merged_at": None,
+            "merge_commit_sha": None,
+        },
+    }
+    repo["next_number"] += 1
+    repo["issues"][issue["number"]] = issue
+    return 201, _pull_json(server, repo, issue)
+
+
+def _get_pull(server, req, owner, name, number):
+    repo = server.state.repo(owner, name)
+    issue = _find_issue(repo, number)
+    if not issue.get("pull"):
+        raise GitHubStubError(404, "Not Found")
+    return 200, _pull_json(server, repo, issue)
+
+
+def _merge_pull(server, req, owner, name, number):
+    state = server.state
+    repo = state.repo(owner, name)
+    issue = _find_issue(repo, number)
+    pull = issue.get("pull")
+    if not pull:
+        raise GitHubStubError(404, "Not Found")
+    if issue["state"] != "open":
+        raise GitHubStubError(405, "Pull Request is not mergeable")
+    if pull["head"] not in repo["branches"] or pull["base"] not in repo["branches"]:
+        raise GitHubStubError(422, "Head or base branch no longer exists")
+    head_sha = repo["branches"][pull["head"]]
+    base_sha = repo["branches"][pull["base"]]
+    if req.body.get("sha") and req.body["sha"] != head_sha:
+        raise GitHubStubError(409, "Head branch was modified. Review and try the merge again.")
+
+    # Three-way apply of the head branch's changes since the merge base
+    base_ancestors = state.ancestors(base_sha)
+    merge_base = head_sha
+    while merge_base not in base_ancestors:
+        parents = state.commits[merge_base]["parents"]
+        if not parents:
+            merge_base = None
+            break
+        merge_base = parents[0]
+    old_tree = state.commits[merge_base]["tree"] if merge_base else {}
+    head_tree = state.commits[head_sha]["tree"]
+    tree = dict(state.commits[base_sha]["tree"])
+    for path in set(old_tree) | set(head_tree):
+        if old_tree.get(path) == head_tree.get(path):
+            continue
+        if tree.get(path) not in (old_tree.get(path), head_tree.get(path)):
+            raise GitHubStubError(405, "Pull Request is not mergeable")
+        if path in head_tree:
+            tree[path] = head_tree[path]
+        else:
+            tree.pop(path, None)
+
+    method = req.body.get("merge_method", "merge")
+    if method not in ("merge", "squash", "rebase"):
+        raise GitHubStubError(422, "Validation Failed",
+                              [{"resource": "PullRequest", "field": "merge_method", "code": "invalid"}])
+    title = req.body.get("commit_title") or f"Merge pull request #{issue['number']}"
+    message = title + ("\n\n" + req.body["commit_message"] if req.body.get("commit_message") else "")
+    parents = [base_sha] if method in ("squash", "rebase") else [base_sha, head_sha]
+    merge_sha = state.make_commit(tree, parents, message)
+    repo["branches"][pull["base"]] = merge_sha
+    issue["state"] = "closed"
+    issue["updated_at"] = issue["closed_at"] = pull["merged_at"] = state.commits[merge_sha]["date"]
+    pull["merge_commit_sha"] = merge_sha
+    return 200, {"sha": merge_sha, "merged": True, "message": "Pull Request successfully merged"}
+
+
+def _get_rate_limit(server, req):
+    state = server.state
+    remaining = state.rate_remaining.get(req.token, state.rate_limit)
+    core = {"limit": state.rate_limit, "remaining": remaining,
+            "reset": state.rate_reset, "used": state.rate_limit - remaining, "resource": "core"}
+    return 200, {"resources": {"core": core}, "rate": core}
+
+
+def _get_raw(server, req, owner, name, ref, path):
+    state = server.state
+    repo = state.repo(owner, name)
+    sha = state.resolve_ref(repo, unquote(ref))
+    tree = state.commits[sha]["tree"] if sha else {}
+    path = unquote(path)
+    if path not in tree:
+        raise GitHubStubError(404, "Not Found")
+    return 200, state.blobs[tree[path]]
+
+
+_REPO = r"/repos/(?P<owner>[^/]+)/(?P<name>[^/]+)"
+ROUTES = [
+    ("GET", r"/user", _get_user),
+    ("GET", r"/user/repos", _list_repos),
+    ("GET", r"/users/(?P<owner>[^/]+)/repos", _list_repos),
+    ("GET", r"/orgs/(?P<owner>[^/]+)/repos", _list_repos),
+    ("GET", r"/rate_limit", _get_rate_limit),
+    ("GET", r"/raw/(?P<owner>[^/]+)/(?P<name>[^/]+)/(?P<ref>[^/]+)/(?P<path>.+)", _get_raw),
+    ("GET", _REPO, _get_repo),
+    ("DELETE", _REPO, _delete_repo),
+    ("POST", _REPO + r"/forks", _fork_repo),
+    ("GET", _REPO + r"/branches", _list_branches),
+    ("GET", _REPO + r"/branches/(?P<branch>.+)", _get_branch),
+    ("GET", _REPO + r"/git/ref/heads/(?P<branch>.+)", _get_ref),
+    ("GET", _REPO + r"/git/refs/heads/(?P<branch>.+)", _get_ref),
+    ("POST", _REPO + r"/git/refs", _create_ref),
+    ("DELETE", _REPO + r"/git/refs/heads/(?P<branch>.+)", _delete_ref),
+    ("GET", _REPO + r"/contents/?", _get_contents),
+    ("GET", _REPO + r"/contents/(?P<path>.+)", _get_contents),
+    ("PUT", _REPO + r"/contents/(?P<path>.+)", _put_contents),
+    ("DELETE", _REPO + r"/contents/(?P<path>.+)", _delete_contents),
+    ("GET", _REPO + r"/commits", _list_commits),
+    ("GET", _REPO + r"/issues", _list_issues),
+    ("POST", _REPO + r"/issues", _create_issue),
+    ("GET", _REPO + r"/issues/(?P<number>\d+)", _get_issue),
+    ("PATCH", _REPO + r"/issues/(?P<number>\d+)", _update_issue),
+    ("GET", _REPO + r"/pulls", _list_pulls),
+    ("POST", _REPO + r"/pulls", _create_pull),
+    ("GET", _REPO + r"/pulls/(?P<number>\d+)", _get_pull),
+    ("PUT", _REPO + r"/pulls/(?P<number>\d+)/merge", _merge_pull),
+]
+PAGINATED = {_list_repos, _list_branches, _list_commits, _list_issues, _list_pulls}
+_COMPILED_ROUTES = [(method, re.compile(pattern + r"$"), handler) for method, pattern, handler in ROUTES]
+
+
+class _Request:
+    """Parsed request passed to route handlers"""
+
+    def __init__(self, headers, query, body, token):
+        self.headers = headers
+        self.query = query
+        self.body = body
+        self.token = token
+
+
+def _make_handler(server):
+    class Handler(BaseHTTPRequestHandler):
+        protocol_version = "HTTP/1.1"
+        server_version = "FakeGitHub/0.0.1"
+        # Headers and body are separate writes; with Nagle on, keep-alive
+        # clients wait on delayed ACKs for every response
+        disable_nagle_algorithm = True
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            self._dispatch("GET")
+
+        def do_HEAD(self):
+            self._dispatch("HEAD")
+
+        def do_POST(self):
+            self._dispatch("POST")
+
+        def do_PUT(self):
+            self._dispatch("PUT")
+
+        def do_PATCH(self):
+            self._dispatch("PATCH")
+
+        def do_DELETE(self):
+            self._dispatch("DELETE")
+
+        def _dispatch(self, method):
+            split = urlsplit(self.path)
+            query = {k: v[-1] for k, v in parse_qs(split.query).items()}
+            length = int(self.headers.get("Content-Length") or 0)
+            raw_body = self.rfile.read(length) if length else b""
+            state = server.state
+
+            auth = self.headers.get("Authorization", "")
+            scheme, _, token = auth.partition(" ")
+            if scheme.lower() not in ("bearer", "token") or not token:
+                token = None
+            if split.path.startswith("/raw/"):
+                token = token or "raw"
+
+            # Only state access holds the lock; parsing, routing, encoding,
+            # pagination and ETags run concurrently across request threads
+            handler = None
+            headers = {}
+            try:
+                if token is None or (server.token and token != server.token):
+                    raise GitHubStubError(401, "Bad credentials")
+                with state.lock:
+                    remaining = state.rate_remaining.get(token, state.rate_limit)
+                if remaining <= 0 and split.path != "/rate_limit":
+                    headers["X-RateLimit-Remaining"] = "0"
+                    headers["X-RateLimit-Used"] = str(state.rate_limit)
+                    raise GitHubStubError(403, "API rate limit exceeded for user.")
+                try:
+                    body = json.loads(raw_body) if raw_body else {}
+                except ValueError:
+                    raise GitHubStubError(400, "Problems parsing JSON")
+                handler, params = self._route(method, split.path)
+                with state.lock:
+                    status, payload = handler(server, _Request(self.headers, query, body, token), **params)
+            except GitHubStubError as e:
+                status, payload = e.status, {"message": e.message, "documentation_url": DOCS_URL,
+                                             "status": str(e.status)}
+                if e.errors:
+                    payload["errors"] = e.errors
+            except Exception as e:
+                status, payload = 500, {"message": f"Stub error: {e!r}", "documentation_url": DOCS_URL,
+                                        "status": "500"}
+
+            if isinstance(payload, bytes):
+                data, content_type = payload, "application/vnd.github.raw"
+            else:
+                data = b"" if payload is None else json.dumps(payload).encode("utf-8")
+                content_type = "application/json; charset=utf-8"
+
+            if isinstance(payload, list) and handler in PAGINATED:
+                data, link = self._paginate(payload, split.path, query)
+                if link:
+                    headers["Link"] = link
+
+            if method in ("GET", "HEAD") and status == 200:
+                etag = '"%s"' % hashlib.sha1(data).hexdigest()
+                headers["ETag"] = etag
+                if etag in [t.strip() for t in self.headers.get("If-None-Match", "").split(",")]:
+                    status, data = 304, b""
+
+            with state.lock:
+                state.request_count += 1
+                if status == 304:
+                    state.not_modified_count += 1
+                if token is not None:
+                    remaining = state.rate_remaining.get(token, state.rate_limit)
+                    # Conditional hits and auth failures are free, like on GitHub
+                    if status not in (304, 401) and split.path != "/rate_limit" \
+                            and not split.path.startswith("/raw/") and remaining > 0:
+                        remaining -= 1
+                        state.rate_remaining[token] = remaining
+                    headers.update({
+                        "X-RateLimit-Limit": str(state.rate_limit),
+                        "X-RateLimit-Reset": str(state.rate_reset),
+                        "X-RateLimit-Resource": "core",
+                    })
+                    headers.setdefault("X-RateLimit-Remaining", str(remaining))
+                    headers.setdefault("X-RateLimit-Used", str(state.rate_limit - remaining))
+
+            self.send_response(status)
+            if data:
+                self.send_header("Content-Type", content_type)
+            self.send_header("Content-Length", str(len(data)))
+            self.send_header("X-GitHub-Api-Version-Selected", "2022-11-28")
+            for key, value in headers.items():
+                self.send_header(key, value)
+            self.end_headers()
+            if data and method != "HEAD":
+                self.wfile.write(data)
+
+        def _route(self, method, path):
+            if method == "HEAD":
+                method = "GET"
+            path_matched = False
+            for route_method, pattern, handler in _COMPILED_ROUTES:
+                match = pattern.match(path)
+                if not match:
+                    continue
+                path_matched = True
+                if route_method == method:
+                    return handler, match.groupdict()
+            if path_matched:
+                raise GitHubStubError(405, "Method Not Allowed")
+            raise GitHubStubError(404, "Not Found")
+
+        def _paginate(self, items, path, query):
+            try:
+                per_page = max(1, min(100, int(query.get("per_page", 30))))
+                page = max(1, int(query.get("page", 1)))
+            except ValueError:
+                per_page, page = 30, 1
+            last = max(1, -(-len(items) // per_page))
+            chunk = items[(page - 1) * per_page:page * per_page]
+
+            def page_url(number):
+                params = dict(query, per_page=per_page, page=number)
+                return f"<{server.base_url}{path}?{urlencode(params)}>"
+
+            links = []
+            if page < last:
+                links += [f'{page_url(page + 1)}; rel="next"', f'{page_url(last)}; rel="last"']
+            if page > 1:
+                links += [f'{page_url(1)}; rel="first"', f'{page_url(page - 1)}; rel="prev"']
+            return json.dumps(chunk).encode("utf-8"), ", ".join(links)
+
+    return Handler
+
+
+def offline_enabled():
+    """True when GITHUB_OPS_OFFLINE is set to a truthy value"""
+    return os.getenv(OFFLINE_ENV, "").lower() not in ("", "0", "false", "no")
+
+
+def start_offline_server(config, owner=DEFAULT_USER, repo="dummy-repo", files=None):
+    """
+    Start a seeded stub and point ``config`` at it when GITHUB_OPS_OFFLINE is set.
+
+    Returns the running server, or None (and leaves config untouched) when
+    offline mode is off. The server thread is a daemon and ends with the
+    process.
+    """
+    if not offline_enabled():
+        return None
+    server = FakeGitHubServer(user=owner).start()
+    server.seed_repository(owner, repo, DUMMY_REPO_FILES if files is None else files,
+                           description="Offline stand-in for kilgor/dummy-repo")
+    server.configure(config)
+    print(f"[offline] Using fake GitHub API at {server.base_url}")
+    return server
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Run the offline GitHub API stand-in")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--user", default=DEFAULT_USER)
+    parser.add_argument("--rate-limit", type=int, default=DEFAULT_RATE_LIMIT)
+    args = parser.parse_args(argv)
+
+    server = FakeGitHubServer(host=args.host, port=args.port, user=args.user, rate_limit=args.rate_limit)
+    server.seed_repository(args.user, "dummy-repo", DUMMY_REPO_FILES,
+                           description="Offline stand-in for kilgor/dummy-repo")
+    print(f"Fake GitHub API listening on {server.base_url} (Ctrl+C to stop)")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+
+
+if __name__ == "__main__":
+    main()
@@ -22,6 +22,8 @@ spec = importlib.util.spec_from_file_location(
 github_ops = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(github_ops)
 
+from fake_github_server import start_offline_server
+
 # Import all 20 functions
 GitHubConfig = github_ops.GitHubConfig
 list_repositories = github_ops.list_repositories
@@ -54,6 +56,7 @@ def test_all_20_functions():
     print("=" * 70)
     
     config = GitHubConfig()
+    start_offline_server(config)  # no-op unless GITHUB_OPS_OFFLINE=1
     test_file_sha = None
     
     # 1. validate_github_token
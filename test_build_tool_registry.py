@@ -0,0 +1,233 @@
+"""
+Offline checks for build_tool_registry.py
+
+Builds registries from synthetic ops modules in a temp directory:
+- TOOL_METADATA with list-of-mapping parameters parses without losing fields
+- Malformed blocks and duplicate operation names are reported, not written
+- Rebuilding an unchanged tree leaves the registry byte-for-byte identical
+- --format conflicting with the -o extension is rejected
+- Wrapped values containing a colon stay in their value
+- Only a real boolean true marks an operation as dangerous
+"""
+
+import contextlib
+import io
+import os
+import sys
+import tempfile
+
+from build_tool_registry import (
+    MetadataParseError,
+    RegistryError,
+    build_registry,
+    load_registry,
+    main,
+    parse_module,
+    parse_tool_metadata,
+)
+
+REAL_SHAPED_MODULE = '''"""
+Sample Ops
+Version: v0.0.1
+"""
+
+
+def get_repository_info(owner, repo, config=None):
+    """
+    Get detailed repository information.
+
+    TOOL_METADATA:
+        name: get_repository_info
+        category: external-operations
+        subcategory: github
+        description: Get detailed information about a repository
+        dangerous: false
+        framework_compatible: [langchain, openai, anthropic]
+        parameters:
+            - name: owner
+              type: string
+              required: true
+              description: Repository owner
+            - name: repo
+              type: string
+              required: true
+        returns:
+            type: dict
+            description: Repository details
+
+    Args:
+        owner: Repository owner
+    """
+    return {}
+'''
+
+MALFORMED_MODULE = '''
+def broken():
+    """
+    TOOL_METADATA:
+        name: broken
+        parameters:
+            - owner
+            type: string
+    """
+'''
+
+DUPLICATE_MODULE = '''
+def get_repository_info():
+    """
+    TOOL_METADATA:
+        name: get_repository_info
+    """
+'''
+
+WRAPPED_METADATA = """
+    TOOL_METADATA:
+        name: create_branch
+        description: Create a branch from a base ref; the branch
+            must exist: otherwise the call fails
+        dangerous: "false"
+        parameters:
+            - name: base
+              description: Base branch
+                  name: defaults to main
+        returns:
+            type: dict
+"""
+
+STRAY_INDENT_METADATA = """
+    TOOL_METADATA:
+        parameters:
+            - name: base
+           type: string
+"""
+
+
+def _write(directory, name, source):
+    path = os.path.join(directory, name)
+    with open(path, "w", encoding="utf-8") as f:
+        f.write(source)
+    return path
+
+
+def _run(argv):
+    """Run the CLI quietly and return its exit code"""
+    with contextlib.redirect_stdout(io.StringIO()):
+        return main(argv)
+
+
+def test_build_tool_registry():
+    """Run the registry builder checks"""
+
+    print("=" * 70)
+    print("BUILD_TOOL_REGISTRY.PY CHECKS")
+    print("=" * 70)
+    failures = []
+
+    def check(label, condition):
+        print(f"{'✅' if condition else '❌'} {label}")
+        if not condition:
+            failures.append(label)
+
+    # Test 1: list-of-mapping parameters
+    print("\n[TEST 1] Real-shaped TOOL_METADATA")
+    docstring = REAL_SHAPED_MODULE.split('"""')[3]
+    metadata = parse_tool_metadata(docstring)
+    params = metadata.get("parameters")
+    check("parameters is a list of 2 mappings",
+          isinstance(params, list) and len(params) == 2 and all(isinstance(p, dict) for p in params))
+    check("first parameter keeps type/required/description",
+          params and params[0] == {"name": "owner", "type": "string", "required": True,
+                                   "description": "Repository owner"})
+    check("type/required do not leak into the top level",
+          "type" not in metadata and "required" not in metadata)
+    check("returns after parameters is kept",
+          metadata.get("returns") == {"type": "dict", "description": "Repository details"})
+    check("framework_compatible parsed as list",
+          metadata.get("framework_compatible") == ["langchain", "openai", "anthropic"])
+
+    # Test 2: malformed blocks raise
+    print("\n[TEST 2] Malformed TOOL_METADATA")
+    try:
+        parse_tool_metadata(MALFORMED_MODULE.split('"""')[1])
+        check("mixed list/mapping block raises MetadataParseError", False)
+    except MetadataParseError:
+        check("mixed list/mapping block raises MetadataParseError", True)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        good = _write(tmp, "sample-ops.py", REAL_SHAPED_MODULE)
+        bad = _write(tmp, "broken-ops.py", MALFORMED_MODULE)
+        dup = _write(tmp, "dup-ops.py", DUPLICATE_MODULE)
+        pattern = os.path.join(tmp, "sample-ops.py")
+        output = os.path.join(tmp, "registry.json")
+
+        try:
+            build_registry([good, bad])
+            check("malformed module rejects the build", False)
+        except RegistryError:
+            check("malformed module rejects the build", True)
+
+        # Test 3: duplicate operation names
+        print("\n[TEST 3] Duplicate operation names")
+        try:
+            build_registry([good, dup])
+            check("duplicate name rejects the build", False)
+        except RegistryError as e:
+            check("duplicate name rejects the build", "get_repository_info" in str(e))
+
+        # Test 4: reproducible output
+        print("\n[TEST 4] Reproducible registry")
+        check("first build succeeds", _run(["--pattern", pattern, "-o", output]) == 0)
+        with open(output, "rb") as f:
+            first = f.read()
+        first_mtime = os.stat(output).st_mtime_ns
+        check("no wall-clock timestamp in registry", b"generated_at" not in first)
+        check("second build succeeds", _run(["--pattern", pattern, "-o", output]) == 0)
+        with open(output, "rb") as f:
+            check("unchanged tree gives identical bytes", f.read() == first)
+        check("unchanged tree is not rewritten", os.stat(output).st_mtime_ns == first_mtime)
+        registry = load_registry(output)
+        op = registry["modules"][pattern.replace(os.sep, "/")]["operations"][0]
+        check("registry stores parsed parameters", op["metadata"]["parameters"][1]["name"] == "repo")
+        check("--check reports up to date", _run(["--pattern", pattern, "-o", output, "--check"]) == 0)
+        with open(good, "a", encoding="utf-8") as f:
+            f.write("# edited\n")
+        check("--check reports stale after edit", _run(["--pattern", pattern, "-o", output, "--check"]) == 1)
+
+        # Test 5: format/extension conflict
+        print("\n[TEST 5] --format vs -o")
+        check("--format msgpack -o *.json is rejected",
+              _run(["--pattern", pattern, "--format", "msgpack", "-o", output]) == 1)
+
+    # Test 6: wrapped values and the dangerous flag
+    print("\n[TEST 6] Wrapped values and dangerous flag")
+    metadata = parse_tool_metadata(WRAPPED_METADATA)
+    check("wrapped line with a colon continues the description",
+          metadata.get("description") ==
+          "Create a branch from a base ref; the branch must exist: otherwise the call fails")
+    check("no fake key from the wrapped line", "must exist" not in metadata)
+    check("wrapped line inside a list item continues its value",
+          metadata.get("parameters") == [{"name": "base", "description": "Base branch name: defaults to main"}])
+    try:
+        parse_tool_metadata(STRAY_INDENT_METADATA)
+        check("stray indentation raises MetadataParseError", False)
+    except MetadataParseError:
+        check("stray indentation raises MetadataParseError", True)
+    source = 'def create_branch():\n    """' + WRAPPED_METADATA + '    """\n'
+    entry = parse_module("branch-ops.py", source.encode("utf-8"))
+    check('quoted "false" is not dangerous', entry["operations"][0]["dangerous"] is False)
+
+    print("\n" + "=" * 70)
+    if failures:
+        print(f"❌ {len(failures)} check(s) failed")
+    else:
+        print("✅ ALL CHECKS PASSED")
+    print("=" * 70)
+    assert not failures, failures
+
+
+if __name__ == "__main__":
+    try:
+        test_build_tool_registry()
+    except AssertionError:
+        sys.exit(1)
+    sys.exit(0)
@@ -20,6 +20,8 @@ spec = importlib.util.spec_from_file_location(
 github_ops = importlib.util.module_from_spec(spec)
 spec.loader.exec_module(github_ops)
 
+from fake_github_server import start_offline_server
+
 GitHubConfig = github_ops.GitHubConfig
 list_repositories = github_ops.list_repositories
 get_repository_info = github_ops.get_repository_info
@@ -40,6 +42,7 @@ def test_dummy_repo():
     print("=" * 70)
     
     config = GitHubConfig()
+    start_offline_server(config)  # no-op unless GITHUB_OPS_OFFLINE=1
     
     # Test 1: Get repository info
     print("\n[TEST 1] get_repository_info('kilgor', 'dummy-repo')")
@@ -49,6 +49,9 @@ create_file = github_ops.create_file
 update_file = github_ops.update_file
 delete_file = github_ops.delete_file
 validate_github_token = github_ops.validate_github_token
+GitHubConfig = github_ops.GitHubConfig
+
+from fake_github_server import offline_enabled, start_offline_server
 
 # Test configuration
 OWNER = "kilgor"
@@ -57,6 +60,14 @@ TEST_BRANCH = f"test-branch-{int(time.time())}"
 TEST_FILE = f"test-file-{int(time.time())}.txt"
 TEST_FILE_2 = f"test-file-2-{int(time.time())}.md"
 
+config = GitHubConfig()
+start_offline_server(config)  # no-op unless GITHUB_OPS_OFFLINE=1
+
+def pause(seconds):
+    """Wait for GitHub to settle; the offline stub is consistent immediately"""
+    if not offline_enabled():
+        time.sleep(seconds)
+
 # Colors for output
 GREEN = "\033[92m"
 RED = "\033[91m"
@@ -141,7 +152,7 @@ print(f"Timestamp: {datetime.now().isoformat()}")
 # ============================================================================
 print_header("1. UTILITIES - TOKEN VALIDATION")
 
-result = validate_github_token()
+result = validate_github_token(config)
 if result.get("success"):
     log_test("validate_github_token", "PASSED", f"User: {result.get('data', {}).get('login', 'N/A')}")
 else:
@@ -155,7 +166,7 @@ else:
 print_header("2. REPOSITORIES - LIST & GET INFO")
 
 # List repositories
-result = list_repositories(type="all", sort="full_name")
+result = list_repositories(type="all", sort="full_name", config=config)
 if result.get("success"):
     repos = result.get("data", [])
     log_test("list_repositories", "PASSED", f"Found {len(repos)} repositories")
@@ -163,7 +174,7 @@ else:
     log_test("list_repositories", "FAILED", data=result)
 
 # Get repository info
-result = get_repository_info(owner=OWNER, repo=REPO)
+result = get_repository_info(owner=OWNER, repo=REPO, config=config)
 if result.get("success"):
     repo_data = result.get("data", {})
     log_test("get_repository_info", "PASSED", 
@@ -179,7 +190,7 @@ else:
 print_header("3. BRANCHES - LIST, CREATE, DELETE")
 
 # List branches
-result = list_branches(owner=OWNER, repo=REPO)
+result = list_branches(owner=OWNER, repo=REPO, config=config)
 if result.get("success"):
     branches = result.get("data", [])
     log_test("list_branches", "PASSED", f"Found {len(branches)} branches")
@@ -196,7 +207,7 @@ else:
 
 # Create branch
 if default_branch_sha:
-    result = create_branch(owner=OWNER, repo=REPO, branch=TEST_BRANCH, sha=default_branch_sha)
+    result = create_branch(owner=OWNER, repo=REPO, branch=TEST_BRANCH, sha=default_branch_sha, config=config)
     if result.get("success"):
         log_test("create_branch", "PASSED", f"Created branch: {TEST_BRANCH}")
     else:
@@ -210,7 +221,7 @@ else:
 print_header("4. CONTENTS - CREATE, READ, UPDATE, DELETE")
 
 # List repository contents (root)
-result = list_repository_contents(owner=OWNER, repo=REPO, path="")
+result = list_repository_contents(owner=OWNER, repo=REPO, path="", config=config)
 if result.get("success"):
     contents = result.get("data", [])
     log_test("list_repository_contents", "PASSED", f"Found {len(contents)} items in root")
@@ -225,7 +236,8 @@ result = create_file(
     path=TEST_FILE,
     message=f"Create {TEST_FILE} for testing",
     content=file_content,
-    branch=TEST_BRANCH
+    branch=TEST_BRANCH,
+    config=config
 )
 if result.get("success"):
     log_test("create_file", "PASSED", f"Created {TEST_FILE} on {TEST_BRANCH}")
@@ -235,8 +247,8 @@ else:
     FILE_SHA = None
 
 # Get file content
-time.sleep(1)  # Brief delay to ensure file is created
-result = get_file_content(owner=OWNER, repo=REPO, path=TEST_FILE, ref=TEST_BRANCH)
+pause(1)  # Brief delay to ensure file is created
+result = get_file_content(owner=OWNER, repo=REPO, path=TEST_FILE, ref=TEST_BRANCH, config=config)
 if result.get("success"):
     content = result.get("data", {}).get("content", "")
     log_test("get_file_content", "PASSED", f"Retrieved {len(content)} bytes")
@@ -253,7 +265,8 @@ if FILE_SHA:
         message=f"Update {TEST_FILE}",
         content=updated_content,
         sha=FILE_SHA,
-        branch=TEST_BRANCH
+        branch=TEST_BRANCH,
+        config=config
     )
     if result.get("success"):
         log_test("update_file", "PASSED", f"Updated {TEST_FILE}")
@@ -270,7 +283,8 @@ result = create_file(
     path=TEST_FILE_2,
     message=f"Create {TEST_FILE_2} for PR testing",
     content=f"# PR Test File\n\nCreated at: {datetime.now().isoformat()}",
-    branch=TEST_BRANCH
+    branch=TEST_BRANCH,
+    config=config
 )
 if result.get("success"):
     log_test("create_file (2nd)", "PASSED", f"Created {TEST_FILE_2}")
@@ -282,7 +296,7 @@ else:
 # ============================================================================
 print_header("5. COMMITS - LIST COMMITS")
 
-result = list_commits(owner=OWNER, repo=REPO, branch=TEST_BRANCH, limit=10)
+result = list_commits(owner=OWNER, repo=REPO, branch=TEST_BRANCH, limit=10, config=config)
 if result.get("success"):
     commits = result.get("data", [])
     log_test("list_commits", "PASSED", f"Found {len(commits)} commits on {TEST_BRANCH}")
@@ -303,7 +317,8 @@ result = create_pull_request(
     title=PR_TITLE,
     body=PR_BODY,
     head=TEST_BRANCH,
-    base=DEFAULT_BRANCH
+    base=DEFAULT_BRANCH,
+    config=config
 )
 
 PR_NUMBER = None
@@ -315,7 +330,7 @@ else:
     log_test("create_pull_request", "FAILED", data=result)
 
 # List pull requests
-result = list_pull_requests(owner=OWNER, repo=REPO, state="open")
+result = list_pull_requests(owner=OWNER, repo=REPO, state="open", config=config)
 if result.get("success"):
     prs = result.get("data", [])
     log_test("list_pull_requests", "PASSED", f"Found {len(prs)} open PRs")
@@ -324,14 +339,15 @@ else:
 
 # Merge pull request (if created)
 if PR_NUMBER:
-    time.sleep(2)  # Wait for PR to be ready
+    pause(2)  # Wait for PR to be ready
     result = merge_pull_request(
         owner=OWNER,
         repo=REPO,
         pull_number=PR_NUMBER,
         commit_title=f"Merge test PR #{PR_NUMBER}",
         commit_message="Automated merge from comprehensive test",
-        merge_method="squash"
+        merge_method="squash",
+        config=config
     )
     if result.get("success"):
         log_test("merge_pull_request", "PASSED", f"Merged PR #{PR_NUMBER}")
@@ -353,7 +369,8 @@ result = create_issue(
     repo=REPO,
     title=ISSUE_TITLE,
     body=ISSUE_BODY,
-    labels=["test", "automated"]
+    labels=["test", "automated"],
+    config=config
 )
 
 ISSUE_NUMBER = None
@@ -365,7 +382,7 @@ else:
     log_test("create_issue", "FAILED", data=result)
 
 # List issues
-result = list_issues(owner=OWNER, repo=REPO, state="open")
+result = list_issues(owner=OWNER, repo=REPO, state="open", config=config)
 if result.get("success"):
     issues = result.get("data", [])
     log_test("list_issues", "PASSED", f"Found {len(issues)} open issues")
@@ -380,7 +397,8 @@ if ISSUE_NUMBER:
         issue_number=ISSUE_NUMBER,
         title=f"{ISSUE_TITLE} [UPDATED]",
         body=f"{ISSUE_BODY}\n\n**UPDATED**: Test completed successfully!",
-        state="closed"
+        state="closed",
+        config=config
     )
     if result.get("success"):
         log_test("update_issue", "PASSED", f"Updated and closed issue #{ISSUE_NUMBER}")
@@ -395,10 +413,10 @@ else:
 print_header("8. CLEANUP - DELETE FILES & BRANCH")
 
 # Get updated file SHAs from default branch (after merge)
-time.sleep(2)  # Wait for merge to complete
+pause(2)  # Wait for merge to complete
 
 # Delete first file
-result = get_file_content(owner=OWNER, repo=REPO, path=TEST_FILE, ref=DEFAULT_BRANCH)
+result = get_file_content(owner=OWNER, repo=REPO, path=TEST_FILE, ref=DEFAULT_BRANCH, config=config)
 if result.get("success"):
     file_sha = result.get("data", {}).get("sha")
     result = delete_file(
@@ -407,7 +425,8 @@ if result.get("success"):
         path=TEST_FILE,
         message=f"Delete {TEST_FILE} after testing",
         sha=file_sha,
-        branch=DEFAULT_BRANCH
+        branch=DEFAULT_BRANCH,
+        config=config
     )
     if result.get("success"):
         log_test("delete_file (1st)", "PASSED", f"Deleted {TEST_FILE}")
@@ -417,7 +436,7 @@ else:
     log_test("delete_file (1st)", "SKIPPED", "File not found on default branch")
 
 # Delete second file
-result = get_file_content(owner=OWNER, repo=REPO, path=TEST_FILE_2, ref=DEFAULT_BRANCH)
+result = get_file_content(owner=OWNER, repo=REPO, path=TEST_FILE_2, ref=DEFAULT_BRANCH, config=config)
 if result.get("success"):
     file_sha = result.get("data", {}).get("sha")
     result = delete_file(
@@ -426,7 +445,8 @@ if result.get("success"):
         path=TEST_FILE_2,
         message=f"Delete {TEST_FILE_2} after testing",
         sha=file_sha,
-        branch=DEFAULT_BRANCH
+        branch=DEFAULT_BRANCH,
+        config=config
     )
     if result.get("success"):
         log_test("delete_file (2nd)", "PASSED", f"Deleted {TEST_FILE_2}")
@@ -436,7 +456,7 @@ else:
     log_test("delete_file (2nd)", "SKIPPED", "File not found on default branch")
 
 # Delete test branch
-result = delete_branch(owner=OWNER, repo=REPO, branch_name=TEST_BRANCH)
+result = delete_branch(owner=OWNER, repo=REPO, branch_name=TEST_BRANCH, config=config)
 if result.get("success"):
     log_test("delete_branch", "PASSED", f"Deleted branch: {TEST_BRANCH}")
 else:
@@ -465,7 +485,9 @@ log_test("delete_repository", "SKIPPED", "Manual test only - DANGEROUS!")
 print_summary()
 
 # Save results to file
-results_file = f"test/results/github-ops-comprehensive-test-{int(time.time())}.json"
+# Keep stub runs apart from runs against the real API
+results_prefix = "github-ops-offline-test" if offline_enabled() else "github-ops-comprehensive-test"
+results_file = f"test/results/{results_prefix}-{int(time.time())}.json"
 os.makedirs("test/results", exist_ok=True)
 
 with open(results_file, 'w') as f:
@@ -0,0 +1,225 @@
+"""
+Offline checks for fake_github_server.py
+
+Talks HTTP to a seeded stub on a free local port:
+- Contents CRUD (create, read, raw media types, update, delete)
+- Branch refs (get via git/ref and git/refs, create, tag refs rejected)
+- Pull request create and merge
+- Link pagination
+- ETag / 304 conditional requests
+- X-RateLimit-* headers and exhaustion
+- download_url on a branch with a slash, HEAD requests
+- Concurrent clients
+"""
+
+import base64
+import json
+import sys
+import threading
+import urllib.error
+import urllib.request
+from urllib.parse import quote
+
+from fake_github_server import DUMMY_REPO_FILES, FakeGitHubServer, git_blob_sha
+
+OWNER = "kilgor"
+REPO = f"/repos/{OWNER}/dummy-repo"
+
+
+def _call(server, method, path, body=None, headers=None, token="offline-token"):
+    """Send one request and return (status, headers, decoded body)"""
+    request_headers = {"Authorization": f"Bearer {token}"}
+    request_headers.update(headers or {})
+    data = json.dumps(body).encode("utf-8") if body is not None else None
+    request = urllib.request.Request(server.base_url + path, data=data, method=method,
+                                     headers=request_headers)
+    try:
+        with urllib.request.urlopen(request) as response:
+            status, response_headers, raw = response.status, response.headers, response.read()
+    except urllib.error.HTTPError as e:
+        status, response_headers, raw = e.code, e.headers, e.read()
+    if raw and "json" in response_headers.get("Content-Type", ""):
+        return status, response_headers, json.loads(raw)
+    return status, response_headers, raw
+
+
+def _start(**kwargs):
+    server = FakeGitHubServer(user=OWNER, **kwargs).start()
+    server.seed_repository(OWNER, "dummy-repo", DUMMY_REPO_FILES)
+    return server
+
+
+def test_fake_github_server():
+    """Run the stub server checks"""
+
+    print("=" * 70)
+    print("FAKE_GITHUB_SERVER.PY CHECKS")
+    print("=" * 70)
+    failures = []
+
+    def check(label, condition):
+        print(f"{'✅' if condition else '❌'} {label}")
+        if not condition:
+            failures.append(label)
+
+    with _start() as server:
+        # Test 1: contents CRUD
+        print("\n[TEST 1] Contents CRUD")
+        status, _, listing = _call(server, "GET", f"{REPO}/contents/")
+        check("root listing returns seeded files",
+              status == 200 and "README.md" in [entry["path"] for entry in listing])
+
+        status, _, created = _call(server, "PUT", f"{REPO}/contents/notes/a.txt",
+                                   {"message": "Add note", "content": base64.b64encode(b"one").decode()})
+        check("create file returns 201", status == 201)
+        sha = created["content"]["sha"] if status == 201 else None
+        check("blob sha matches git", sha == git_blob_sha(b"one"))
+
+        status, _, content = _call(server, "GET", f"{REPO}/contents/notes/a.txt")
+        check("read file returns base64 content",
+              status == 200 and base64.b64decode(content["content"]) == b"one")
+
+        for accept in ("application/vnd.github.raw", "application/vnd.github.v3.raw"):
+            status, _, raw = _call(server, "GET", f"{REPO}/contents/notes/a.txt", headers={"Accept": accept})
+            check(f"Accept {accept} returns raw bytes", status == 200 and raw == b"one")
+
+        status, _, _ = _call(server, "PUT", f"{REPO}/contents/notes/a.txt",
+                             {"message": "Update", "content": base64.b64encode(b"two").decode()})
+        check("update without sha is rejected with 422", status == 422)
+        status, _, updated = _call(server, "PUT", f"{REPO}/contents/notes/a.txt",
+                                   {"message": "Update", "content": base64.b64encode(b"two").decode(),
+                                    "sha": sha})
+        check("update with sha returns 200", status == 200)
+        new_sha = updated["content"]["sha"] if status == 200 else None
+
+        status, _, _ = _call(server, "DELETE", f"{REPO}/contents/notes/a.txt",
+                             {"message": "Remove", "sha": sha})
+        check("delete with stale sha returns 409", status == 409)
+        status, _, _ = _call(server, "DELETE", f"{REPO}/contents/notes/a.txt",
+                             {"message": "Remove", "sha": new_sha})
+        check("delete returns 200", status == 200)
+        status, _, _ = _call(server, "GET", f"{REPO}/contents/notes/a.txt")
+        check("deleted file returns 404", status == 404)
+
+        # Test 2: refs
+        print("\n[TEST 2] Branch refs")
+        status, _, ref = _call(server, "GET", f"{REPO}/git/ref/heads/main")
+        check("GET git/ref/heads/main returns 200", status == 200)
+        main_sha = ref["object"]["sha"] if status == 200 else None
+        status, _, ref = _call(server, "GET", f"{REPO}/git/refs/heads/main")
+        check("GET git/refs/heads/main returns the same ref",
+              status == 200 and ref["object"]["sha"] == main_sha)
+        status, _, _ = _call(server, "POST", f"{REPO}/git/refs", {"ref": "refs/tags/v1.0", "sha": main_sha})
+        check("tag ref is rejected with 422", status == 422)
+        status, _, _ = _call(server, "GET", f"{REPO}/branches/tags/v1.0")
+        check("rejected tag did not become a branch", status == 404)
+        status, _, _ = _call(server, "POST", f"{REPO}/git/refs", {"ref": "refs/heads/feature", "sha": main_sha})
+        check("branch ref created with 201", status == 201)
+
+        # Test 3: pull request merge
+        print("\n[TEST 3] Pull request merge")
+        _call(server, "PUT", f"{REPO}/contents/feature.txt",
+              {"message": "Feature", "content": base64.b64encode(b"feature").decode(), "branch": "feature"})
+        status, _, pull = _call(server, "POST", f"{REPO}/pulls",
+                                {"title": "Feature", "head": "feature", "base": "main"})
+        check("pull request created with 201", status == 201)
+        number = pull["number"] if status == 201 else 0
+        status, _, merged = _call(server, "PUT", f"{REPO}/pulls/{number}/merge", {"merge_method": "squash"})
+        check("merge returns merged=true", status == 200 and merged.get("merged") is True)
+        status, _, _ = _call(server, "GET", f"{REPO}/contents/feature.txt")
+        check("merged file present on base branch", status == 200)
+        status, _, pull = _call(server, "GET", f"{REPO}/pulls/{number}")
+        check("pull request closed after merge", status == 200 and pull["state"] == "closed")
+        status, _, _ = _call(server, "PUT", f"{REPO}/pulls/{number}/merge", {})
+        check("second merge returns 405", status == 405)
+
+        # Test 4: pagination
+        print("\n[TEST 4] Link pagination")
+        status, headers, commits = _call(server, "GET", f"{REPO}/commits?per_page=1")
+        link = headers.get("Link") or ""
+        check("one commit per page", status == 200 and len(commits) == 1)
+        check("Link header has next and last", 'rel="next"' in link and 'rel="last"' in link)
+        status, headers, _ = _call(server, "GET", f"{REPO}/commits?per_page=1&page=2")
+        check("second page links back to prev", 'rel="prev"' in (headers.get("Link") or ""))
+
+        # Test 5: conditional requests
+        print("\n[TEST 5] ETag / 304")
+        status, headers, _ = _call(server, "GET", f"{REPO}/contents/README.md")
+        etag = headers.get("ETag")
+        remaining = int(headers.get("X-RateLimit-Remaining", -1))
+        check("ETag returned", status == 200 and bool(etag))
+        status, headers, body = _call(server, "GET", f"{REPO}/contents/README.md",
+                                      headers={"If-None-Match": etag})
+        check("matching If-None-Match returns 304 with no body", status == 304 and not body)
+        check("304 does not count against the rate limit",
+              int(headers.get("X-RateLimit-Remaining", -1)) == remaining)
+
+    # Test 6: rate limit
+    print("\n[TEST 6] Rate-limit headers")
+    with _start(rate_limit=2) as server:
+        status, headers, _ = _call(server, "GET", "/user")
+        check("X-RateLimit-Limit/Remaining/Reset present",
+              headers.get("X-RateLimit-Limit") == "2" and headers.get("X-RateLimit-Remaining") == "1"
+              and headers.get("X-RateLimit-Reset") is not None)
+        _call(server, "GET", "/user")
+        status, headers, _ = _call(server, "GET", "/user")
+        check("exhausted limit returns 403", status == 403 and headers.get("X-RateLimit-Remaining") == "0")
+        status, _, _ = _call(server, "GET", "/rate_limit")
+        check("/rate_limit still answers when exhausted", status == 200)
+        status, headers, _ = _call(server, "GET", "/user", token="other-token")
+        check("limits are tracked per token", status == 200)
+
+    with _start() as server:
+        # Test 7: refs with a slash and HEAD
+        print("\n[TEST 7] Slashed refs and HEAD")
+        _, _, ref = _call(server, "GET", f"{REPO}/git/ref/heads/main")
+        _call(server, "POST", f"{REPO}/git/refs", {"ref": "refs/heads/feature/x", "sha": ref["object"]["sha"]})
+        _call(server, "PUT", f"{REPO}/contents/docs/x.md",
+              {"message": "Add x", "content": base64.b64encode(b"x").decode(), "branch": "feature/x"})
+        status, _, content = _call(server, "GET", f"{REPO}/contents/docs/x.md?ref={quote('feature/x', safe='')}")
+        check("contents on feature/x returns 200", status == 200)
+        download_url = content["download_url"] if status == 200 else ""
+        status, _, raw = _call(server, "GET", download_url[len(server.base_url):])
+        check("download_url on feature/x returns the file", status == 200 and raw == b"x")
+        status, _, _ = _call(server, "GET", content["url"][len(server.base_url):])
+        check("url on feature/x returns the file", status == 200)
+        status, headers, body = _call(server, "HEAD", f"{REPO}/contents/README.md")
+        check("HEAD returns 200 with headers and no body",
+              status == 200 and not body and bool(headers.get("ETag")))
+
+        # Test 8: concurrent clients
+        print("\n[TEST 8] Concurrent clients")
+        _, _, limits = _call(server, "GET", "/rate_limit")
+        used_before = limits["rate"]["used"]
+        before = server.request_count
+        statuses = []
+
+        def client():
+            for _ in range(25):
+                statuses.append(_call(server, "GET", f"{REPO}/contents/README.md")[0])
+
+        threads = [threading.Thread(target=client) for _ in range(8)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        check("200 concurrent requests all succeed", statuses.count(200) == 200)
+        check("every request counted once", server.request_count - before == 200)
+        _, _, limits = _call(server, "GET", "/rate_limit")
+        check("rate limit charged once per request", limits["rate"]["used"] - used_before == 200)
+
+    print("\n" + "=" * 70)
+    if failures:
+        print(f"❌ {len(failures)} check(s) failed")
+    else:
+        print("✅ ALL CHECKS PASSED")
+    print("=" * 70)
+    assert not failures, failures
+
+
+if __name__ == "__main__":
+    try:
+        test_fake_github_server()
+    except AssertionError:
+        sys.exit(1)
+    sys.exit(0)
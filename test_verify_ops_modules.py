@@ -0,0 +1,165 @@
+"""
+Offline checks for verify_ops_modules.py
+
+Runs the verifier on synthetic modules in a temp directory:
+- Real-shaped TOOL_METADATA (list-of-mapping parameters) passes cleanly
+- Trailing whitespace inside docstrings is counted
+- Emoji and Turkish characters inside f-strings are found
+- github-ops specific checks (GitHubConfig, imports, __all__, metadata count)
+- A non-UTF-8 module is reported per file instead of aborting the run
+- Cache entries are dropped when the verifier itself changes
+"""
+
+import json
+import os
+import sys
+import tempfile
+
+from verify_ops_modules import verify_modules, verify_source
+
+GOOD_MODULE = '''"""
+Sample Ops
+Version: v0.0.1
+Author: Ali Cem Topcu <alicemtopcu@yahoo.com>
+GitHub: @kilgor
+LinkedIn: https://www.linkedin.com/in/example
+"""
+
+from src.ops_core import (
+    BaseConfig,
+    OperationError,
+    create_success_response,
+    create_error_response,
+    validate_required_params,
+    log_operation,
+)
+
+__all__ = ["SampleConfig", "get_repository_info"]
+
+
+class SampleConfig(BaseConfig):
+    pass
+
+
+def get_repository_info(owner, repo, config=None):
+    """
+    Get detailed repository information.
+
+    TOOL_METADATA:
+        name: get_repository_info
+        category: external-operations
+        subcategory: github
+        description: Get detailed information about a repository
+        dangerous: false
+        framework_compatible: [langchain, openai, anthropic]
+        parameters:
+            - name: owner
+              type: string
+              required: true
+            - name: repo
+              type: string
+              required: true
+        returns:
+            type: dict
+            description: Repository details
+    """
+    try:
+        log_operation("get_repository_info")
+        validate_required_params(owner=owner, repo=repo)
+        return create_success_response({})
+    except OperationError as e:
+        return create_error_response(str(e))
+'''
+
+
+def _findings(result, rule=None):
+    return [f for f in result["findings"] if f["level"] == "error" and (rule is None or f["rule"] == rule)]
+
+
+def test_verify_ops_modules():
+    """Run the verifier checks"""
+
+    print("=" * 70)
+    print("VERIFY_OPS_MODULES.PY CHECKS")
+    print("=" * 70)
+    failures = []
+
+    def check(label, condition):
+        print(f"{'✅' if condition else '❌'} {label}")
+        if not condition:
+            failures.append(label)
+
+    # Test 1: list-of-mapping parameters do not produce false errors
+    print("\n[TEST 1] Real-shaped TOOL_METADATA")
+    result = verify_source("sample-ops.py", GOOD_MODULE)
+    check("no errors for a compliant module", not _findings(result))
+    check("metadata coverage 1/1", result["stats"].get("metadata_coverage") == "1/1")
+
+    # Test 2: trailing whitespace inside docstrings
+    print("\n[TEST 2] Trailing whitespace in docstrings")
+    padded = GOOD_MODULE.replace("Get detailed repository information.",
+                                 "Get detailed repository information.   \n    one \n    two\t")
+    result = verify_source("sample-ops.py", padded)
+    check("3 docstring lines counted", result["stats"].get("trailing_whitespace_lines") == 3)
+
+    # Test 2b: text checks see f-string literal text
+    print("\n[TEST 2b] Emoji / non-English text in f-strings")
+    fstring = GOOD_MODULE.replace('return create_success_response({})',
+                                  'return create_success_response(f"Done \U0001F680 {owner} \u011f")')
+    result = verify_source("sample-ops.py", fstring)
+    rules = {f["rule"] for f in result["findings"]}
+    check("emoji inside an f-string is reported", bool(_findings(result, "no-emoji")))
+    check("Turkish character inside an f-string is reported", "english-only" in rules)
+
+    # Test 3: github-ops specific checks
+    print("\n[TEST 3] github-ops module expectations")
+    result = verify_source("github-ops.py", GOOD_MODULE)
+    messages = " | ".join(f["message"] for f in _findings(result))
+    check("GitHubConfig required", "GitHubConfig" in messages)
+    check("requests/base64 imports required", "requests" in messages and "base64" in messages)
+    check("expected __all__ exports required", "Missing exports in __all__" in messages)
+    check("TOOL_METADATA count must match expected functions", "Expected 20 TOOL_METADATA blocks, found 1" in messages)
+
+    with tempfile.TemporaryDirectory() as tmp:
+        good = os.path.join(tmp, "sample-ops.py")
+        with open(good, "w", encoding="utf-8") as f:
+            f.write(GOOD_MODULE)
+        binary = os.path.join(tmp, "binary-ops.py")
+        with open(binary, "wb") as f:
+            f.write(b'"""\xff\xfe not utf-8"""\n')
+        cache = os.path.join(tmp, "cache.json")
+
+        # Test 4: undecodable module is a per-file finding
+        print("\n[TEST 4] Non-UTF-8 module")
+        results, checked = verify_modules([good, binary], jobs=2, cache_path=cache)
+        key = binary.replace(os.sep, "/")
+        check("run completes for both modules", len(checked) == 2)
+        check("encoding error reported for the binary module", bool(_findings(results[key], "encoding")))
+
+        # Test 5: cache keyed by verifier version
+        print("\n[TEST 5] Cache invalidation")
+        _, checked = verify_modules([good, binary], jobs=1, cache_path=cache)
+        check("unchanged modules served from cache", checked == [])
+        with open(cache, "r", encoding="utf-8") as f:
+            data = json.load(f)
+        data["engine"] = "older-verifier"
+        with open(cache, "w", encoding="utf-8") as f:
+            json.dump(data, f)
+        _, checked = verify_modules([good, binary], jobs=1, cache_path=cache)
+        check("cache from another verifier version is ignored", len(checked) == 2)
+
+    print("\n" + "=" * 70)
+    if failures:
+        print(f"❌ {len(failures)} check(s) failed")
+    else:
+        print("✅ ALL CHECKS PASSED")
+    print("=" * 70)
+    assert not failures, failures
+
+
+if __name__ == "__main__":
+    try:
+        test_verify_ops_modules()
+    except AssertionError:
+        sys.exit(1)
+    sys.exit(0)
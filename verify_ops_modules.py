@@ -0,0 +1,630 @@
+"""
+Single-pass static verifier for ops modules
+
+Replaces the overlapping checks in simple_test_github.py,
+import_test_github.py, checklist_verification.py and verify_tool_metadata.py
+with one engine: each module is parsed once into an AST plus a token stream
+and every rule runs as a visitor over that single walk. Results are cached
+per source hash and verifier version (a hash of this file and
+build_tool_registry.py), and modules are verified in parallel across cores.
+Checks specific to one module (required classes, imports, __all__ exports,
+expected functions and TOOL_METADATA count) live in the per-module tables
+next to EXPECTED_FUNCTIONS.
+
+Usage:
+    python verify_ops_modules.py                      # all library/*/*-ops.py
+    python verify_ops_modules.py path/to/x-ops.py ... # specific modules
+    python verify_ops_modules.py --jobs 8 --no-cache
+"""
+
+import argparse
+import ast
+import hashlib
+import io
+import json
+import os
+import re
+import sys
+import tokenize
+from concurrent.futures import ProcessPoolExecutor
+
+import build_tool_registry
+from build_tool_registry import (
+    OPS_GLOB,
+    MetadataParseError,
+    discover_modules,
+    parse_tool_metadata,
+    source_hash,
+)
+
+ENGINE_VERSION = 1
+CACHE_FILE = ".ops_verify_cache.json"
+
+EXPECTED_VERSION = "0.0.1"
+AUTHOR_MARKERS = {
+    "name": "Ali Cem Topcu",
+    "email": "alicemtopcu@yahoo.com",
+}
+REQUIRED_CORE_IMPORTS = [
+    "BaseConfig",
+    "OperationError",
+    "create_success_response",
+    "create_error_response",
+    "validate_required_params",
+]
+REQUIRED_METADATA_FIELDS = [
+    "name",
+    "category",
+    "subcategory",
+    "description",
+    "dangerous",
+    "framework_compatible",
+    "parameters",
+    "returns",
+]
+EXPECTED_FUNCTIONS = {
+    "github-ops": [
+        "list_repositories", "get_repository_info", "delete_repository", "fork_repository",
+        "list_branches", "create_branch", "delete_branch",
+        "list_pull_requests", "create_pull_request", "merge_pull_request",
+        "list_commits",
+        "list_issues", "create_issue", "update_issue",
+        "get_file_content", "list_repository_contents", "create_file", "update_file", "delete_file",
+        "validate_github_token",
+    ],
+}
+# Module-specific checks carried over from import_test_github.py and
+# simple_test_github.py
+REQUIRED_CLASSES = {
+    "github-ops": ["GitHubConfig"],
+}
+REQUIRED_MODULE_IMPORTS = {
+    "github-ops": ["requests", "base64"],
+}
+EXPECTED_EXPORTS = {
+    "github-ops": [
+        "GitHubConfig", "list_repositories", "get_repository_info", "list_issues",
+        "create_issue", "update_issue", "get_file_content", "list_repository_contents",
+        "validate_github_token",
+    ],
+}
+
+EMOJI_PATTERN = re.compile(
+    "["
+    "\U0001F600-\U0001F64F"  # emoticons
+    "\U0001F300-\U0001F5FF"  # symbols & pictographs
+    "\U0001F680-\U0001F6FF"  # transport & map symbols
+    "\U0001F1E0-\U0001F1FF"  # flags
+    "\U00002702-\U000027B0"
+    "\U000024C2-\U0001F251"
+    "]"
+)
+NON_ENGLISH_PATTERN = re.compile("[ğĞüÜşŞıİöÖçÇ]")
+
+
+class ModuleContext:
+    """Everything the rules share about one module during the single pass"""
+
+    def __init__(self, path, source):
+        self.path = path
+        self.module = os.path.splitext(os.path.basename(path))[0]
+        self.source = source
+        self.tree = None
+        self.findings = []
+        self.stats = {}
+
+    def error(self, rule, message, line=None):
+        self.findings.append({"rule": rule, "level": "error", "line": line, "message": message})
+
+    def warn(self, rule, message, line=None):
+        self.findings.append({"rule": rule, "level": "warning", "line": line, "message": message})
+
+
+class Rule:
+    """
+    Base class for verifier rules.
+
+    node_types lists the AST node classes passed to visit_node; tokens=True
+    makes the rule receive every token. ``func`` is the enclosing top-level
+    public function node (or None).
+    """
+
+    name = ""
+    node_types = ()
+    tokens = False
+
+    def start(self, ctx):
+        pass
+
+    def visit_node(self, node, func, ctx):
+        pass
+
+    def visit_token(self, tok, ctx):
+        pass
+
+    def finish(self, ctx):
+        pass
+
+
+class VersionRule(Rule):
+    name = "version"
+
+    def start(self, ctx):
+        doc = ast.get_docstring(ctx.tree) or ""
+        if not doc:
+            ctx.error(self.name, "No module docstring")
+            return
+        match = re.search(r"Version:\s*v?([\d.]+)", doc)
+        if not match:
+            ctx.error(self.name, "No version found in module docstring")
+        elif match.group(1) != EXPECTED_VERSION:
+            ctx.warn(self.name, f"Version is v{match.group(1)} (expected v{EXPECTED_VERSION})")
+
+
+# Python 3.12+ splits f-strings (and 3.14+ t-strings) into separate tokens,
+# with the literal text in *STRING_MIDDLE instead of one STRING token
+TEXT_TOKENS = tuple(
+    token_type
+    for token_type in (
+        tokenize.STRING,
+        tokenize.COMMENT,
+        tokenize.NAME,
+        getattr(tokenize, "FSTRING_MIDDLE", None),
+        getattr(tokenize, "TSTRING_MIDDLE", None),
+    )
+    if token_type is not None
+)
+
+
+class TextRule(Rule):
+    """Emoji, English-only and author checks over string and comment tokens"""
+
+    name = "text"
+    tokens = True
+
+    def start(self, ctx):
+        self.found_author = dict.fromkeys(AUTHOR_MARKERS, False)
+        self.found_github = False
+        self.found_linkedin = False
+        self.emoji_lines = []
+        self.non_english_lines = []
+
+    def visit_token(self, tok, ctx):
+        if tok.type not in TEXT_TOKENS:
+            return
+        text = tok.string
+        if EMOJI_PATTERN.search(text):
+            self.emoji_lines.append(tok.start[0])
+        if NON_ENGLISH_PATTERN.search(text):
+            self.non_english_lines.append(tok.start[0])
+        if tok.type == tokenize.NAME:
+            return
+        for key, marker in AUTHOR_MARKERS.items():
+            if not self.found_author[key] and marker in text:
+                self.found_author[key] = True
+        lowered = text.lower()
+        if "@kilgor" in text or "github.com" in lowered:
+            self.found_github = True
+        if "linkedin.com" in lowered:
+            self.found_linkedin = True
+
+    def finish(self, ctx):
+        if self.emoji_lines:
+            ctx.error("no-emoji", f"Emoji characters on {len(self.emoji_lines)} token(s)", self.emoji_lines[0])
+        if self.non_english_lines:
+            ctx.warn("english-only", "Turkish or special characters detected", self.non_english_lines[0])
+        missing = [key for key, found in self.found_author.items() if not found]
+        if not self.found_github:
+            missing.append("GitHub")
+        if not self.found_linkedin:
+            missing.append("LinkedIn")
+        if missing:
+            ctx.error("author", f"Missing author info: {', '.join(missing)}")
+
+
+class ImportRule(Rule):
+    name = "imports"
+    node_types = (ast.ImportFrom,)
+
+    def start(self, ctx):
+        self.core_names = set()
+        self.has_core_import = False
+
+    def visit_node(self, node, func, ctx):
+        if node.level and node.module == "ops_core":
+            ctx.error(self.name, "Relative import (from .ops_core) - should be 'from src.ops_core'", node.lineno)
+        if node.module == "src.ops_core":
+            self.has_core_import = True
+            self.core_names.update(alias.name for alias in node.names)
+
+    def finish(self, ctx):
+        if not self.has_core_import:
+            ctx.error(self.name, "Missing 'from src.ops_core import' statement")
+            return
+        missing = [name for name in REQUIRED_CORE_IMPORTS if name not in self.core_names]
+        if missing:
+            ctx.error(self.name, f"Missing Pure Logic imports: {', '.join(missing)}")
+
+
+class ConfigClassRule(Rule):
+    name = "config-class"
+    node_types = (ast.ClassDef,)
+
+    def start(self, ctx):
+        self.found = False
+
+    def visit_node(self, node, func, ctx):
+        if not node.name.endswith("Config"):
+            return
+        for base in node.bases:
+            base_name = base.attr if isinstance(base, ast.Attribute) else getattr(base, "id", None)
+            if base_name == "BaseConfig":
+                self.found = True
+
+    def finish(self, ctx):
+        if not self.found:
+            ctx.error(self.name, "No configuration class extending BaseConfig")
+
+
+class ExportsRule(Rule):
+    name = "exports"
+    node_types = (ast.Assign,)
+
+    def start(self, ctx):
+        self.exports = None
+
+    def visit_node(self, node, func, ctx):
+        if func is not None or self.exports is not None:
+            return
+        if any(isinstance(t, ast.Name) and t.id == "__all__" for t in node.targets):
+            if isinstance(node.value, (ast.List, ast.Tuple)):
+                self.exports = [
+                    elt.value for elt in node.value.elts
+                    if isinstance(elt, ast.Constant) and isinstance(elt.value, str)
+                ]
+            else:
+                self.exports = []
+                ctx.warn(self.name, "__all__ found but could not parse", node.lineno)
+
+    def finish(self, ctx):
+        if self.exports is None:
+            ctx.error(self.name, "No __all__ exports list")
+            return
+        ctx.stats["exports"] = len(self.exports)
+        ctx.stats["exports_list"] = self.exports
+        defined = set(ctx.stats.get("public_functions", [])) | set(ctx.stats.get("classes", []))
+        undefined = [name for name in self.exports if name not in defined]
+        if undefined:
+            ctx.warn(self.name, f"__all__ names not defined at module level: {', '.join(undefined)}")
+        missing = [name for name in ctx.stats.get("public_functions", []) if name not in self.exports]
+        if missing:
+            ctx.warn(self.name, f"Public functions missing from __all__: {', '.join(missing)}")
+
+
+class FunctionRule(Rule):
+    """TOOL_METADATA coverage, try/except and logging per public function"""
+
+    name = "functions"
+    node_types = (ast.Try, ast.Call)
+
+    def start(self, ctx):
+        self.public = []
+        self.classes = []
+        self.helpers = 0
+        self.with_try = set()
+        self.with_logging = set()
+        self.log_calls = 0
+        self.success_responses = 0
+        self.error_responses = 0
+        self.dangerous = []
+        for node in ctx.tree.body:
+            if isinstance(node, ast.ClassDef):
+                self.classes.append(node.name)
+            elif isinstance(node, (ast.FunctionDef, ast.AsyncFunctionDef)):
+                if node.name.startswith("_"):
+                    self.helpers += 1
+                else:
+                    self.public.append(node)
+        ctx.stats["public_functions"] = [node.name for node in self.public]
+        ctx.stats["classes"] = self.classes
+        ctx.stats["helper_functions"] = self.helpers
+
+    def visit_node(self, node, func, ctx):
+        if isinstance(node, ast.Try):
+            if func is not None:
+                self.with_try.add(func.name)
+            return
+        callee = node.func
+        name = callee.attr if isinstance(callee, ast.Attribute) else getattr(callee, "id", None)
+        if name == "log_operation":
+            self.log_calls += 1
+            if func is not None:
+                self.with_logging.add(func.name)
+        elif name == "create_success_response":
+            self.success_responses += 1
+        elif name == "create_error_response":
+            self.error_responses += 1
+
+    def finish(self, ctx):
+        missing_metadata = []
+        metadata_blocks = 0
+        for node in self.public:
+            try:
+                metadata = parse_tool_metadata(ast.get_docstring(node))
+            except MetadataParseError as e:
+                metadata_blocks += 1
+                ctx.error("tool-metadata", f"{node.name}: malformed TOOL_METADATA: {e}", node.lineno)
+                continue
+            if metadata is None:
+                missing_metadata.append(node.name)
+                continue
+            metadata_blocks += 1
+            missing_fields = [f for f in REQUIRED_METADATA_FIELDS if f not in metadata]
+            if missing_fields:
+                ctx.error("tool-metadata", f"{node.name}: TOOL_METADATA missing fields: {', '.join(missing_fields)}", node.lineno)
+            if metadata.get("dangerous") is True:
+                self.dangerous.append(node.name)
+        if missing_metadata:
+            ctx.error("tool-metadata", f"Missing TOOL_METADATA: {', '.join(missing_metadata)}")
+
+        names = [node.name for node in self.public]
+        expected = EXPECTED_FUNCTIONS.get(ctx.module)
+        if expected:
+            absent = [name for name in expected if name not in names]
+            if absent:
+                ctx.error("expected-functions", f"Missing expected functions: {', '.join(absent)}")
+            if metadata_blocks != len(expected):
+                ctx.error("tool-metadata",
+                          f"Expected {len(expected)} TOOL_METADATA blocks, found {metadata_blocks}")
+
+        without_try = [name for name in names if name not in self.with_try]
+        if names and len(without_try) > len(names) * 0.2:
+            ctx.warn("try-except", f"Functions without try-except: {', '.join(without_try)}")
+        if names and not self.log_calls:
+            ctx.warn("logging", "No log_operation() calls found")
+
+        ctx.stats.update({
+            "metadata_coverage": f"{len(names) - len(missing_metadata)}/{len(names)}",
+            "functions_with_try": len(self.with_try),
+            "functions_with_logging": len(self.with_logging),
+            "log_operation_calls": self.log_calls,
+            "success_responses": self.success_responses,
+            "error_responses": self.error_responses,
+            "dangerous": self.dangerous,
+        })
+
+
+class LayoutRule(Rule):
+    """Line count and trailing whitespace, including inside docstrings"""
+
+    name = "layout"
+
+    def finish(self, ctx):
+        lines = ctx.source.splitlines()
+        self.trailing = sum(1 for line in lines if line.endswith((" ", "\t")))
+        ctx.stats["lines"] = len(lines)
+        ctx.stats["trailing_whitespace_lines"] = self.trailing
+        ctx.stats["bytes"] = len(ctx.source.encode("utf-8"))
+        if self.trailing > 10:
+            ctx.warn(self.name, f"Trailing whitespace on {self.trailing} lines (cosmetic)")
+
+
+class ModuleExpectationsRule(Rule):
+    """Per-module classes, imports and __all__ exports that must be present"""
+
+    name = "module-expectations"
+    node_types = (ast.Import, ast.ImportFrom)
+
+    def start(self, ctx):
+        self.imported = set()
+
+    def visit_node(self, node, func, ctx):
+        if isinstance(node, ast.Import):
+            self.imported.update(alias.name.split(".")[0] for alias in node.names)
+        elif node.module and not node.level:
+            self.imported.add(node.module.split(".")[0])
+
+    def finish(self, ctx):
+        classes = set(ctx.stats.get("classes", []))
+        missing = [name for name in REQUIRED_CLASSES.get(ctx.module, []) if name not in classes]
+        if missing:
+            ctx.error(self.name, f"Missing required classes: {', '.join(missing)}")
+        missing = [name for name in REQUIRED_MODULE_IMPORTS.get(ctx.module, []) if name not in self.imported]
+        if missing:
+            ctx.error(self.name, f"Missing imports: {', '.join(missing)}")
+        exports = ctx.stats.get("exports_list")
+        if exports is not None:
+            missing = [name for name in EXPECTED_EXPORTS.get(ctx.module, []) if name not in exports]
+            if missing:
+                ctx.error(self.name, f"Missing exports in __all__: {', '.join(missing)}")
+
+
+RULES = [VersionRule, TextRule, ImportRule, ConfigClassRule, FunctionRule, ExportsRule,
+         ModuleExpectationsRule, LayoutRule]
+
+
+def _walk(tree):
+    """Yield (node, enclosing top-level public function) for every node once"""
+    stack = []
+    for top in reversed(tree.body):
+        func = None
+        if isinstance(top, (ast.FunctionDef, ast.AsyncFunctionDef)) and not top.name.startswith("_"):
+            func = top
+        stack.append((top, func))
+    while stack:
+        node, func = stack.pop()
+        yield node, func
+        children = list(ast.iter_child_nodes(node))
+        for child in reversed(children):
+            stack.append((child, func))
+
+
+def verify_source(path, source):
+    """Run every rule over one module in a single AST walk and token pass"""
+    ctx = ModuleContext(path, source)
+    try:
+        ctx.tree = ast.parse(source, filename=path)
+    except SyntaxError as e:
+        ctx.error("syntax", f"Syntax error: {e.msg}", e.lineno)
+        return {"findings": ctx.findings, "stats": ctx.stats}
+
+    rules = [rule_class() for rule_class in RULES]
+    for rule in rules:
+        rule.start(ctx)
+
+    by_type = {}
+    for rule in rules:
+        for node_type in rule.node_types:
+            by_type.setdefault(node_type, []).append(rule)
+    for node, func in _walk(ctx.tree):
+        for rule in by_type.get(type(node), ()):
+            rule.visit_node(node, func, ctx)
+
+    token_rules = [rule for rule in rules if rule.tokens]
+    try:
+        for tok in tokenize.generate_tokens(io.StringIO(source).readline):
+            for rule in token_rules:
+                rule.visit_token(tok, ctx)
+    except (tokenize.TokenError, IndentationError) as e:
+        ctx.error("syntax", f"Tokenize error: {e}")
+
+    for rule in rules:
+        rule.finish(ctx)
+    return {"findings": ctx.findings, "stats": ctx.stats}
+
+
+def _verify_file(path, digest):
+    """Worker entry point: verify one file, returning (path, digest, result)"""
+    with open(path, "rb") as f:
+        raw = f.read()
+    try:
+        source = raw.decode("utf-8")
+    except UnicodeDecodeError as e:
+        finding = {"rule": "encoding", "level": "error", "line": None,
+                   "message": f"Not valid UTF-8: {e}"}
+        return path, digest, {"findings": [finding], "stats": {}}
+    return path, digest, verify_source(path, source)
+
+
+def _engine_hash():
+    """Hash of the verifier and registry parser sources, part of the cache key"""
+    digest = hashlib.sha256(str(ENGINE_VERSION).encode("ascii"))
+    for module_path in (os.path.abspath(__file__), os.path.abspath(build_tool_registry.__file__)):
+        with open(module_path, "rb") as f:
+            digest.update(f.read())
+    return digest.hexdigest()
+
+
+def _load_cache(cache_path):
+    if not cache_path or not os.path.exists(cache_path):
+        return {}
+    try:
+        with open(cache_path, "r", encoding="utf-8") as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        return {}
+    if cache.get("engine") != _engine_hash():
+        return {}
+    return cache.get("files", {})
+
+
+def _save_cache(cache_path, files):
+    if not cache_path:
+        return
+    with open(cache_path, "w", encoding="utf-8") as f:
+        json.dump({"engine": _engine_hash(), "files": files}, f, separators=(",", ":"))
+
+
+def verify_modules(paths, jobs=None, cache_path=CACHE_FILE):
+    """
+    Verify many modules, skipping those whose hash matches the cache.
+
+    Returns (results, checked) where results maps path -> result dict and
+    checked lists the paths that were actually verified this run.
+    """
+    cached = _load_cache(cache_path)
+    results = {}
+    pending = []
+    for path in paths:
+        with open(path, "rb") as f:
+            digest = source_hash(f.read())
+        key = path.replace(os.sep, "/")
+        entry = cached.get(key)
+        if entry and entry.get("sha256") == digest:
+            results[key] = entry["result"]
+        else:
+            pending.append((path, digest))
+
+    checked = []
+    if len(pending) > 1 and (jobs is None or jobs > 1):
+        with ProcessPoolExecutor(max_workers=jobs) as pool:
+            outcomes = list(pool.map(_verify_file, *zip(*pending)))
+    else:
+        outcomes = [_verify_file(path, digest) for path, digest in pending]
+
+    for path, digest, result in outcomes:
+        key = path.replace(os.sep, "/")
+        results[key] = result
+        cached[key] = {"sha256": digest, "result": result}
+        checked.append(key)
+
+    if checked:
+        _save_cache(cache_path, cached)
+    return results, checked
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Single-pass static verifier for ops modules")
+    parser.add_argument("paths", nargs="*", help=f"modules to verify (default: {OPS_GLOB})")
+    parser.add_argument("--jobs", "-j", type=int, default=None, help="worker processes (default: CPU count)")
+    parser.add_argument("--no-cache", action="store_true", help="verify every module, ignore the cache")
+    parser.add_argument("--json", action="store_true", help="print results as JSON")
+    args = parser.parse_args(argv)
+
+    paths = args.paths or discover_modules()
+    if not paths:
+        print(f"❌ No ops modules found for pattern: {OPS_GLOB}")
+        return 1
+    missing = [path for path in paths if not os.path.exists(path)]
+    if missing:
+        print(f"❌ File not found: {', '.join(missing)}")
+        return 1
+
+    results, checked = verify_modules(paths, jobs=args.jobs, cache_path=None if args.no_cache else CACHE_FILE)
+
+    if args.json:
+        print(json.dumps(results, indent=2))
+    else:
+        print("=" * 70)
+        print("OPS MODULE VERIFICATION")
+        print("=" * 70)
+        print(f"\n   Modules: {len(results)} ({len(checked)} checked, {len(results) - len(checked)} cached)")
+        for key, result in results.items():
+            errors = [f for f in result["findings"] if f["level"] == "error"]
+            warnings = [f for f in result["findings"] if f["level"] == "warning"]
+            status = "❌" if errors else "✅"
+            stats = result["stats"]
+            print(f"\n{status} {key}")
+            if "public_functions" in stats:
+                print(f"   Functions: {len(stats['public_functions'])} public, {stats['helper_functions']} helpers")
+                print(f"   TOOL_METADATA: {stats['metadata_coverage']}")
+            if stats.get("dangerous"):
+                print(f"   Dangerous: {', '.join(stats['dangerous'])}")
+            for finding in errors + warnings:
+                marker = "❌" if finding["level"] == "error" else "⚠️ "
+                where = f" (line {finding['line']})" if finding["line"] else ""
+                print(f"   {marker} [{finding['rule']}] {finding['message']}{where}")
+        print("\n" + "=" * 70)
+
+    failed = sum(1 for r in results.values() if any(f["level"] == "error" for f in r["findings"]))
+    if not args.json:
+        if failed:
+            print(f"❌ {failed}/{len(results)} module(s) failed verification")
+        else:
+            print(f"✅ ALL {len(results)} MODULE(S) PASSED")
+        print("=" * 70)
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())